@@ -16,24 +16,195 @@ Use Python/GitHub API to retrieve Issues/Repos information of the past 1 year fo
 '''
 # Import all the required packages 
 import os
-from flask import Flask, jsonify, request, make_response, Response
+import asyncio
+import calendar
+import threading
+import time
+import math
+import hashlib
+import decimal
+import gzip
+import importlib.util
+import queue
+from flask import Flask, jsonify, request, make_response, Response, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-import json
-import dateutil.relativedelta
-from dateutil import *
-from datetime import date, datetime
+import orjson
+from datetime import date, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import httpx
+from cachetools import LRUCache, TTLCache
 from dotenv import load_dotenv
 
+# Numba is optional, without it monthly counts always use the numpy path
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# HTTP/2 needs the optional h2 package (httpx[http2]), otherwise GitHub is called over HTTP/1.1
+# (only checked for, httpx imports it itself)
+HTTP2 = importlib.util.find_spec("h2") is not None
+
 # Load environment variables from .env file
 load_dotenv()
 
+# numpy arrays/scalars are serialized natively, dict keys may be dates or numbers (e.g. counts by month)
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Serialize the values orjson doesn't handle itself (pandas timestamps and periods, decimals)
+def orjson_default(obj):
+    if obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    if isinstance(obj, (pd.Period, decimal.Decimal)):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# JSON provider backed by orjson, which serializes much faster than the standard library
+class OrjsonProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    # Build the response from the encoded bytes directly instead of going through a str
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=orjson_default, option=ORJSON_OPTIONS), mimetype="application/json")
+
 # Initilize flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 # Handles CORS (cross-origin resource sharing)
 CORS(app)
 
+# Seconds to wait for a forecast from the LSTM microservice before giving up
+FORECAST_TIMEOUT = 120
+
+# Image URLs reported when a forecast is unavailable
+EMPTY_IMAGE_URLS = {
+    "model_loss_image_url": "",
+    "lstm_generated_image_url": "",
+    "all_issues_data_image": ""
+}
+
+# Endpoint of the GitHub GraphQL API, used by every GitHub fetcher except the repository lookup
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Longest wait (in seconds) before retrying a rate limited GitHub request
+MAX_RETRY_WAIT = 60
+
+# Below this many remaining GitHub requests, the next ones are spread out until the rate limit resets
+# instead of running into 403 responses
+RATE_LIMIT_BUFFER = int(os.environ.get('GH_RATE_LIMIT_BUFFER', 50))
+
+# Most pages of 100 commits fetched per month, so very active repositories still respond in bounded time
+MAX_PAGES_PER_MONTH = int(os.environ.get('GH_MAX_PAGES_PER_MONTH', 20))
+
+# Set BATCH_LSTM=true once the forecasting service accepts several "types" in one request,
+# then the created and closed issue forecasts are requested together, the issues are uploaded once
+# Request:  {"issues": [...], "types": ["created_at", "closed_at"], "repo": "..."}
+# Response: {"created": {<image URLs>}, "closed": {<image URLs>}}, each like the response of a single type
+BATCH_LSTM = os.environ.get('BATCH_LSTM', 'false').lower() == 'true'
+
+# Set FORECAST_GZIP=true once the forecasting service accepts gzip request bodies (Content-Encoding: gzip),
+# then the forecast bodies (one record per issue) are uploaded compressed, usually 5-10x smaller
+# (responses from GitHub and the forecasting service are already gzip, requests and httpx ask for it by default)
+FORECAST_GZIP = os.environ.get('FORECAST_GZIP', 'false').lower() == 'true'
+
+# Retry policy that waits at most MAX_RETRY_WAIT seconds for a Retry-After, like post_graphql
+# (a longer wait would block the request thread, the request fails instead once the retries run out)
+class CappedRetry(Retry):
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_WAIT)
+
+# Shared HTTP sessions keep connections to GitHub and the forecasting service alive between requests
+# (separate sessions so the two hosts don't share a connection pool)
+GITHUB_SESSION = requests.Session()
+GITHUB_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=20, pool_maxsize=20,
+    # GraphQL POSTs are read-only queries, so they are safe to retry as well
+    # (429 responses are retried after their Retry-After, up to MAX_RETRY_WAIT seconds)
+    max_retries=CappedRetry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                            allowed_methods=frozenset(["GET", "POST"]))))
+GITHUB_SESSION.headers.update({"Accept": "application/vnd.github+json"})
+
+FORECAST_SESSION = requests.Session()
+# A forecast only depends on its body, so its POSTs are retried when Cloud Run answers
+# 502-504 while an instance starts, instead of returning a response without images
+# (the last response is still returned when the retries run out, so callers see its status)
+# Connection errors are retried too since nothing was sent, but read errors are not: a forecast that
+# timed out is still running on the service and sending it again would only pile up more inference
+FORECAST_RETRY = Retry(total=3, read=0, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                       allowed_methods=frozenset(["GET", "POST"]), raise_on_status=False)
+FORECAST_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=FORECAST_RETRY))
+FORECAST_SESSION.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=FORECAST_RETRY))
+
+# Base URL of the forecasting service, the same service the /api/github route posts forecasts to
+if os.environ.get('FLASK_ENV', '') == 'development':
+    FORECAST_BASE_URL = "http://lstm-service:8080/"
+else:
+    # Update your Google cloud deployed LSTM app URL (NOTE: DO NOT REMOVE "/")
+    FORECAST_BASE_URL = os.environ.get("LSTM_API_URL", "https://forecast-service-852131999673.us-central1.run.app/")
+
+# Forecast endpoint of each model type, built once instead of on every request
+FORECAST_URLS = {model: FORECAST_BASE_URL + f"forecast-{model}" for model in ('lstm', 'statsmodel', 'prophet')}
+
+# Seconds between health checks that keep the forecasting service warm and its connection open (0 disables them)
+FORECAST_KEEPALIVE_INTERVAL = int(os.environ.get('FORECAST_KEEPALIVE_INTERVAL', 30))
+# Set once the health checks run, they start with the first forecast of the process (see start_forecast_keepalive)
+FORECAST_KEEPALIVE_STARTED = threading.Event()
+FORECAST_KEEPALIVE_LOCK = threading.Lock()
+
+# Threads posting forecasts that a request waits on together (e.g. created and closed issues),
+# shared so a request doesn't start and stop its own pool
+FORECAST_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+
+# Most forecast POSTs in flight at once across all requests of this process, the rest wait for a free slot
+# (defaults to the connection pool size of FORECAST_SESSION, so every POST reuses a pooled connection
+# and a burst of requests doesn't make Cloud Run start extra instances)
+# The limit is per gunicorn worker: with several workers the forecasting service can get up to
+# workers x FORECAST_MAX_CONCURRENCY POSTs at once, so divide the budget by the worker count
+FORECAST_MAX_CONCURRENCY = int(os.environ.get('FORECAST_MAX_CONCURRENCY', 20))
+FORECAST_SLOTS = threading.BoundedSemaphore(FORECAST_MAX_CONCURRENCY)
+
+# Cache GitHub data for 10 minutes so repeat requests for a repository are served from memory
+GITHUB_DATA_CACHE = TTLCache(maxsize=64, ttl=600)
+REPOSITORY_CACHE = TTLCache(maxsize=64, ttl=600)
+# Lock of each repository and day whose issues and pull requests are being fetched
+GITHUB_FETCH_LOCKS = TTLCache(maxsize=64, ttl=600)
+# GraphQL responses by query hash, kept for 5 minutes (GraphQL has no ETags to revalidate with)
+GRAPHQL_CACHE = TTLCache(maxsize=1024, ttl=300)
+# Monthly counts and forecasts by a hash of their input, kept for 5 minutes so refreshes skip the work
+MONTHLY_COUNTS_CACHE = TTLCache(maxsize=256, ttl=300)
+# Identical month aggregates give identical forecasts, so these are kept for 10 minutes
+FORECAST_CACHE = TTLCache(maxsize=64, ttl=600)
+# Issues, pull requests and commits of each month that ended before today, by repository and month,
+# kept for an hour since only edits (e.g. closing an issue) change them; the current month is always fetched
+MONTH_CACHE = TTLCache(maxsize=1024, ttl=3600)
+# Encoded /api/github responses by repository, data type, model and day, so repeated refreshes of
+# the React app are answered without any fetching, formatting, forecasting or serializing
+RESPONSE_CACHE = TTLCache(maxsize=128, ttl=600)
+# Last ETag and decoded body seen for each GitHub REST URL and token, used for conditional requests
+# (bounded, the least recently used URLs are dropped; entries don't expire since they are revalidated)
+ETAG_CACHE = LRUCache(maxsize=256)
+# Remaining requests and reset time of each token and rate limit (core or graphql) that is below RATE_LIMIT_BUFFER
+RATE_LIMITS = {}
+# Guards the caches when requests are served from multiple threads
+CACHE_LOCK = threading.Lock()
+
 # Add response headers to accept all types of  requests
 def build_preflight_response():
     response = make_response()
@@ -63,153 +234,513 @@ def health():
     }), 200
 
 '''
-Helper function to fetch GitHub commits data using GraphQL API
-GraphQL is more efficient for fetching complex data like commits
+Helper function to decode a JSON response body
+Raises for error status codes instead of returning GitHub's {"message": ...} error body
+Works for both requests and httpx responses
 '''
-def fetch_github_commits(repo_name, today, headers, months=12):
-    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
-    response_data = []
+def json_of(response):
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+'''
+Helper function to get forecast image URLs from the forecasting service through the cache
+Identical requests (same URL and body) within 10 minutes reuse the previous image URLs
+The body is sent gzip compressed when FORECAST_GZIP is set
+'''
+def post_forecast(url, body, timeout=FORECAST_TIMEOUT):
+    payload = orjson.dumps(body, default=orjson_default, option=ORJSON_OPTIONS)
+    key = hashlib.blake2b(url.encode() + payload, digest_size=16).hexdigest()
     
-    # Split repository name
-    owner, name = repo_name.split('/')
+    with CACHE_LOCK:
+        if key in FORECAST_CACHE:
+            return FORECAST_CACHE[key]
+    
+    headers = {'content-type': 'application/json'}
+    if FORECAST_GZIP:
+        # A low compression level already shrinks the repetitive JSON most of the way, at a fraction of the CPU
+        payload = gzip.compress(payload, compresslevel=5)
+        headers['content-encoding'] = 'gzip'
+    
+    start_forecast_keepalive()
+    with FORECAST_SLOTS:
+        response = FORECAST_SESSION.post(url,
+                                         data=payload,
+                                         headers=headers,
+                                         timeout=timeout)
+    image_urls = json_of(response)
+    
+    with CACHE_LOCK:
+        FORECAST_CACHE[key] = image_urls
+    
+    return image_urls
+
+'''
+Helper function to ping the forecasting service in the background
+Keeps a Cloud Run instance warm and the pooled connection of FORECAST_SESSION open,
+so forecasts don't pay for a cold start or a new TLS handshake
+'''
+def forecast_keepalive():
+    while True:
+        try:
+            FORECAST_SESSION.get(FORECAST_BASE_URL + "health", timeout=10)
+        except requests.RequestException as e:
+            print(f"Forecast service keepalive failed: {str(e)}")
+        time.sleep(FORECAST_KEEPALIVE_INTERVAL)
+
+'''
+Helper function to start the forecast_keepalive thread, once per process
+Called on the first use of FORECAST_SESSION rather than on import, so importing the app
+(scripts, the Flask reloader's parent process) doesn't ping the forecasting service
+'''
+def start_forecast_keepalive():
+    if FORECAST_KEEPALIVE_INTERVAL <= 0 or FORECAST_KEEPALIVE_STARTED.is_set():
+        return
+    with FORECAST_KEEPALIVE_LOCK:
+        if not FORECAST_KEEPALIVE_STARTED.is_set():
+            threading.Thread(target=forecast_keepalive, daemon=True).start()
+            FORECAST_KEEPALIVE_STARTED.set()
+
+'''
+Helper function to record the rate limit headers of a GitHub response
+The core (REST) and graphql limits are counted separately by GitHub, so they are tracked by token and resource
+'''
+def track_rate_limit(headers, resource, response):
+    remaining = response.headers.get('X-RateLimit-Remaining')
+    if remaining is None:
+        return
+    key = (headers.get("Authorization", ""), resource)
+    with CACHE_LOCK:
+        if int(remaining) < RATE_LIMIT_BUFFER:
+            RATE_LIMITS[key] = (int(remaining), int(response.headers['X-RateLimit-Reset']))
+        else:
+            RATE_LIMITS.pop(key, None)
+
+'''
+Helper function to get how long to wait before the next GitHub request of a token and resource
+Once the limit is nearly used up, the remaining requests are spread evenly until the reset
+(up to MAX_RETRY_WAIT seconds each), so concurrent fetches slow down rather than fail
+'''
+def rate_limit_delay(headers, resource):
+    with CACHE_LOCK:
+        limit = RATE_LIMITS.get((headers.get("Authorization", ""), resource))
+    if limit is None:
+        return 0
+    remaining, reset = limit
+    return min(max(reset - time.time(), 0) / (remaining + 1), MAX_RETRY_WAIT)
+
+'''
+Helper function to GET a GitHub REST URL, revalidating with the last ETag seen for it
+On 304 the cached body is reused (304 responses do not count against the GitHub rate limit)
+'''
+def conditional_get(url, headers):
+    # GitHub responses vary by token (private repositories, rate limits), so the ETag is kept per token
+    key = (url, headers.get("Authorization", ""))
+    
+    with CACHE_LOCK:
+        etag, cached_body = ETAG_CACHE.get(key, (None, None))
+    
+    request_headers = dict(headers)
+    if etag:
+        request_headers["If-None-Match"] = etag
+    
+    time.sleep(rate_limit_delay(headers, "core"))
+    response = GITHUB_SESSION.get(url, headers=request_headers)
+    track_rate_limit(headers, "core", response)
+    
+    if response.status_code == 304:
+        return cached_body
+    
+    # Convert the data obtained from GitHub API to JSON format (raises on error responses)
+    body = json_of(response)
+    if response.headers.get("ETag"):
+        with CACHE_LOCK:
+            ETAG_CACHE[key] = (response.headers["ETag"], body)
+    
+    return body
+
+'''
+Helper function to POST a GitHub GraphQL query through the cache
+Keyed by a hash of the query, its variables and the token, responses with errors are not cached
+'''
+def cached_graphql(query, variables, headers):
+    payload = orjson.dumps({"query": query, "variables": variables})
+    key = hashlib.blake2b(headers.get("Authorization", "").encode() + payload, digest_size=16).hexdigest()
+    
+    with CACHE_LOCK:
+        if key in GRAPHQL_CACHE:
+            return GRAPHQL_CACHE[key]
+    
+    # Make POST request to GitHub GraphQL API
+    time.sleep(rate_limit_delay(headers, "graphql"))
+    graphql_response = GITHUB_SESSION.post(
+        GITHUB_GRAPHQL_URL,
+        data=payload,
+        headers={**headers, "Content-Type": "application/json"}
+    )
+    track_rate_limit(headers, "graphql", graphql_response)
+    result = orjson.loads(graphql_response.content)
+    
+    if 'errors' not in result:
+        with CACHE_LOCK:
+            GRAPHQL_CACHE[key] = result
+    
+    return result
+
+'''
+Helper function to fetch the GitHub repository information
+Served from the cache when possible, otherwise revalidated with a conditional request
+'''
+def fetch_repository(repo_name, headers):
+    with CACHE_LOCK:
+        if repo_name in REPOSITORY_CACHE:
+            return REPOSITORY_CACHE[repo_name]
+    
+    # Fetch GitHub data from GitHub API
+    repository = conditional_get("https://api.github.com/repos/" + repo_name, headers)
+    
+    with CACHE_LOCK:
+        REPOSITORY_CACHE[repo_name] = repository
+    
+    return repository
+
+'''
+Helper function to fetch GitHub data (issues or pull requests) through the cache
+Issues and pull requests come from the same search, so both are cached per repository, data type and day
+and a concurrent request for the other type waits for that fetch instead of starting its own
+Returns the DataFrame and whether every request succeeded (always true for cached data)
+'''
+def get_github_data(repo_name, today, headers, data_type):
+    key = (repo_name, data_type, today.isoformat())
     
-    # Iterate through the last 12 months
-    for i in range(months):
-        last_month = today + dateutil.relativedelta.relativedelta(months=-1)
+    with CACHE_LOCK:
+        if key in GITHUB_DATA_CACHE:
+            return GITHUB_DATA_CACHE[key], True
+        fetch_lock = GITHUB_FETCH_LOCKS.setdefault((repo_name, today.isoformat()), threading.Lock())
+    
+    with fetch_lock:
+        # The fetch may have completed while waiting for the lock
+        with CACHE_LOCK:
+            if key in GITHUB_DATA_CACHE:
+                return GITHUB_DATA_CACHE[key], True
         
-        # Format dates for GraphQL query
-        end_date = today.strftime("%Y-%m-%dT%H:%M:%SZ")
-        start_date = last_month.strftime("%Y-%m-%dT%H:%M:%SZ")
+        frames, complete = run_github(fetch_github_data(repo_name, today, headers))
         
-        # Variables for pagination
-        has_next_page = True
-        cursor = None
-        month_commit_count = 0
+        # Only complete fetches are cached (an empty result included), a fetch that failed part way
+        # is retried on the next request
+        if complete:
+            with CACHE_LOCK:
+                for frame_type, df in frames.items():
+                    GITHUB_DATA_CACHE[(repo_name, frame_type, today.isoformat())] = df
+    
+    return frames[data_type], complete
+
+'''
+Helper function to compute the (start, end) dates of each of the past months, newest first
+Cached since every request made on the same day uses the same ranges
+'''
+@lru_cache(maxsize=2)
+def month_ranges(today_iso, months=12):
+    today = date.fromisoformat(today_iso)
+    ranges = []
+    month_end = today
+    
+    for i in range(1, months + 1):
+        # Step back i months from today, clamping the day to the length of that month
+        year, month = divmod(today.year * 12 + today.month - 1 - i, 12)
+        month += 1
+        month_start = date(year, month, min(today.day, calendar.monthrange(year, month)[1]))
+        ranges.append((month_start, month_end))
+        month_end = month_start
+    
+    return tuple(ranges)
+
+# Event loop running the async GitHub fetches of all request threads, with one long-lived client on it
+# Connections stay open between requests, and over HTTP/2 concurrent fetches share one connection
+GITHUB_LOOP = asyncio.new_event_loop()
+threading.Thread(target=GITHUB_LOOP.run_forever, daemon=True).start()
+GITHUB_CLIENT = httpx.AsyncClient(timeout=30, http2=HTTP2)
+
+'''
+Helper function to run a GitHub fetch coroutine on the shared event loop and wait for its result
+'''
+def run_github(coroutine):
+    return asyncio.run_coroutine_threadsafe(coroutine, GITHUB_LOOP).result()
+
+'''
+Helper function to get the seconds a Retry-After header asks to wait
+The header is either a number of seconds or an HTTP date, returns None when it is neither
+'''
+def retry_after_seconds(value):
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+'''
+Helper function to POST a GitHub GraphQL query, retrying rate limited and failed requests
+Waits as long as Retry-After or the rate limit reset asks for (up to MAX_RETRY_WAIT seconds),
+otherwise backs off exponentially; requests are paced once the rate limit is nearly used up
+Connection errors and timeouts are retried too, the last one is raised (httpx.HTTPError)
+'''
+async def post_graphql(payload, headers, retries=5):
+    for attempt in range(retries + 1):
+        await asyncio.sleep(rate_limit_delay(headers, "graphql"))
+        try:
+            response = await GITHUB_CLIENT.post(GITHUB_GRAPHQL_URL, content=orjson.dumps(payload),
+                                                headers={**headers, "Content-Type": "application/json"})
+        except httpx.TransportError as e:
+            if attempt == retries:
+                raise
+            print(f"GitHub request failed ({str(e) or type(e).__name__}), retrying in {2 ** attempt}s")
+            await asyncio.sleep(2 ** attempt)
+            continue
+        track_rate_limit(headers, "graphql", response)
         
-        # Retrieve commits with pagination (no limit - fetch all)
-        while has_next_page:
-            # Construct the cursor part of the query
-            cursor_string = f', after: "{cursor}"' if cursor else ''
-            
-            # GraphQL query to fetch commits with author and date information
-            query = """
-            {
-              repository(owner: "%s", name: "%s") {
-                defaultBranchRef {
-                  target {
-                    ... on Commit {
-                      history(first: 100%s, since: "%s", until: "%s") {
-                        pageInfo {
-                          hasNextPage
-                          endCursor
-                        }
-                        nodes {
-                          oid
-                          committedDate
-                          message
-                          author {
-                            name
-                            email
-                            user {
-                              login
-                            }
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """ % (owner, name, cursor_string, start_date, end_date)
-            
+        rate_limited = response.status_code in (403, 429) and (
+            'Retry-After' in response.headers or response.headers.get('X-RateLimit-Remaining') == '0')
+        if attempt == retries or not (rate_limited or response.status_code >= 500):
+            return response
+        
+        retry_after = retry_after_seconds(response.headers['Retry-After']) if 'Retry-After' in response.headers else None
+        if retry_after is not None:
+            delay = retry_after
+        elif response.headers.get('X-RateLimit-Remaining') == '0':
+            delay = int(response.headers['X-RateLimit-Reset']) - time.time()
+        else:
+            delay = 2 ** attempt
+        delay = min(max(delay, 0), MAX_RETRY_WAIT)
+        print(f"GitHub request failed with {response.status_code}, retrying in {delay:.0f}s")
+        await asyncio.sleep(delay)
+    
+    return response
+
+# Commit history of one month, sent as an aliased sub-query so all months fit in one GraphQL request
+# Each month has its own cursor, since and until variables, prefixed with its alias
+COMMITS_MONTH_QUERY = '''
+  %(alias)s: repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $%(alias)s_cursor, since: $%(alias)s_since, until: $%(alias)s_until) {
+            ...History
+          }
+        }
+      }
+    }
+  }
+'''
+
+# Page of commits selected by every month, sent once per request instead of once per month
+COMMIT_HISTORY_FRAGMENT = '''
+fragment History on CommitHistoryConnection {
+  pageInfo {
+    hasNextPage
+    endCursor
+  }
+  nodes {
+    %(selection)s
+  }
+}
+'''
+
+# GraphQL selection of each commit field that can be requested
+COMMIT_FIELDS = {
+    'oid': 'oid',
+    'committedDate': 'committedDate',
+    'message': 'message',
+    'author': 'author { name email user { login } }',
+}
+
+'''
+Helper function to build the commits query of the given months and commit fields
+The text only depends on which months are still fetched, so each combination is built once
+(and the first request of every repository sends the same text, owner and name are variables)
+'''
+@lru_cache(maxsize=256)
+def commits_query(aliases, fields):
+    declarations = "$owner: String!, $name: String!" + "".join(
+        f", ${alias}_cursor: String, ${alias}_since: GitTimestamp!, ${alias}_until: GitTimestamp!" for alias in aliases)
+    # Fields of each commit, selected once in the fragment shared by all months
+    fragment = COMMIT_HISTORY_FRAGMENT % {"selection": ' '.join(COMMIT_FIELDS[field] for field in fields)}
+    return f"query({declarations}) {{" + "".join(COMMITS_MONTH_QUERY % {"alias": alias} for alias in aliases) + "}" + fragment
+
+'''
+Helper function to fetch GitHub commits data using GraphQL API
+Every month is an aliased sub-query of a single request, follow-up requests only include
+the months that still have more pages
+Only the given fields are requested, returns the commits as a dict of their columns, whether
+any month was cut off at MAX_PAGES_PER_MONTH and whether every request succeeded
+'''
+async def fetch_all_github_commits(repo_name, today, headers, months, fields):
+    # Split repository name
+    owner, name = repo_name.split('/', 1)
+    
+    # Format dates for GraphQL query, one alias per month
+    windows = {f"m{i}": (last_month.strftime("%Y-%m-%dT%H:%M:%SZ"), month_end.strftime("%Y-%m-%dT%H:%M:%SZ"))
+               for i, (last_month, month_end) in enumerate(month_ranges(today.isoformat(), months))}
+    month_data = {alias: [] for alias in windows}
+    pages = {alias: 0 for alias in windows}
+    truncated_months = set()
+    
+    # The windows end at midnight, so every month is finished and can come from the month cache
+    month_keys = {alias: ('commit', repo_name, since, until, tuple(fields)) for alias, (since, until) in windows.items()}
+    with CACHE_LOCK:
+        cached = {alias: MONTH_CACHE[key] for alias, key in month_keys.items() if key in MONTH_CACHE}
+    for alias, (commits, month_truncated) in cached.items():
+        month_data[alias] = commits
+        if month_truncated:
+            truncated_months.add(alias)
+    complete = True
+    
+    # Months still to fetch and the cursor of their next page
+    cursors = {alias: None for alias in windows if alias not in cached}
+    
+    while cursors:
+        # Set the variables of the months in this request
+        variables = {"owner": owner, "name": name}
+        for alias, cursor in cursors.items():
+            variables[f"{alias}_cursor"] = cursor
+            variables[f"{alias}_since"], variables[f"{alias}_until"] = windows[alias]
+        
+        query = commits_query(tuple(cursors), tuple(fields))
+        
+        try:
             # Make POST request to GitHub GraphQL API
-            graphql_response = requests.post(
-                GITHUB_GRAPHQL_URL,
-                json={"query": query},
-                headers=headers
-            )
+            graphql_response = await post_graphql({"query": query, "variables": variables}, headers)
             
             # Process response
-            try:
-                result = graphql_response.json()
-                
-                if 'errors' in result:
-                    print(f"GraphQL Error: {result['errors']}")
-                    break
-                    
-                history = result.get('data', {}).get('repository', {}).get('defaultBranchRef', {}).get('target', {}).get('history', {})
-                commits = history.get('nodes', [])
-                page_info = history.get('pageInfo', {})
-                
-                # Extract pagination info
-                has_next_page = page_info.get('hasNextPage', False)
-                cursor = page_info.get('endCursor')
-                
-                batch_size = len(commits)
-                month_commit_count += batch_size
-                
-                if batch_size == 0:
-                    break
+            result = orjson.loads(graphql_response.content)
+            
+            if 'errors' in result:
+                print(f"GraphQL Error: {result['errors']}")
+                complete = False
+                break
+            
+            next_cursors = {}
+            for alias in cursors:
+                history = result['data'][alias]['defaultBranchRef']['target']['history']
+                commits = history['nodes']
                 
-                for commit in commits:
-                    data = {}
-                    data['commit_hash'] = commit['oid']
-                    data['committed_at'] = commit['committedDate'][:10]  # Just keep the date part
-                    data['message'] = commit['message'].split('\n')[0][:100]  # First line, truncate long messages
-                    
-                    # Author information
-                    author = commit['author']
-                    data['author_name'] = author['name']
-                    data['author_email'] = author['email']
-                    data['author_login'] = author.get('user', {}).get('login', 'unknown')
-                    
-                    response_data.append(data)
-                    
-                # If we got fewer than 100 commits, there are no more to fetch
-                if batch_size < 100:
-                    has_next_page = False
-                    
-            except Exception as e:
-                print(f"Error processing commits: {str(e)}")
-                has_next_page = False
+                month_data[alias].extend(commits)
+                pages[alias] += 1
                 
-        today = last_month
+                # A full page may be followed by more commits
+                if history['pageInfo']['hasNextPage'] and len(commits) == 100:
+                    if pages[alias] < MAX_PAGES_PER_MONTH:
+                        next_cursors[alias] = history['pageInfo']['endCursor']
+                    else:
+                        truncated_months.add(alias)
+            
+            cursors = next_cursors
+            
+        except httpx.HTTPError as e:
+            print(f"GitHub request for commits failed: {str(e)}")
+            complete = False
+            break
+        except Exception as e:
+            print(f"Error processing commits: {str(e)}")
+            complete = False
+            break
+    
+    # Keep the fetched months for the next requests, unless a request failed part way
+    if complete:
+        with CACHE_LOCK:
+            for alias in windows.keys() - cached.keys():
+                MONTH_CACHE[month_keys[alias]] = (month_data[alias], alias in truncated_months)
+    
+    # Combine the months in order, newest first
+    commits = [commit for alias in windows for commit in month_data[alias]]
+    
+    cols = {}
+    if 'oid' in fields:
+        cols['commit_hash'] = [commit['oid'] for commit in commits]
+    if 'committedDate' in fields:
+        cols['committed_at'] = [commit['committedDate'][:10] for commit in commits]  # Just keep the date part
+    if 'message' in fields:
+        # First line, truncate long messages (cutting to 100 characters first gives the same line without scanning the rest)
+        cols['message'] = [commit['message'][:100].partition('\n')[0] for commit in commits]
+    if 'author' in fields:
+        # Author information
+        authors = [commit['author'] or {} for commit in commits]
+        cols['author_name'] = [author.get('name') for author in authors]
+        cols['author_email'] = [author.get('email') for author in authors]
+        cols['author_login'] = [(author.get('user') or {}).get('login', 'unknown') for author in authors]
+    
+    return cols, bool(truncated_months), complete
+
+'''
+Helper function to fetch GitHub commits data for the past months (synchronous entry point)
+Only the hash and date are fetched by default, add 'message' or 'author' to fields when they are needed
+Results are cached per repository, number of months, fields and day like the issues and pull requests
+Returns the commit columns, whether some months were truncated and whether every request succeeded
+'''
+def fetch_github_commits(repo_name, today, headers, months=12, fields=('oid', 'committedDate')):
+    key = (repo_name, 'commit', today.isoformat(), months, tuple(fields))
     
-    return response_data
+    with CACHE_LOCK:
+        if key in GITHUB_DATA_CACHE:
+            return GITHUB_DATA_CACHE[key] + (True,)
+    
+    commits, truncated, complete = run_github(fetch_all_github_commits(repo_name, today, headers, months, fields))
+    
+    # Only complete fetches are cached (no commits included), a fetch that failed part way
+    # is retried on the next request
+    if complete:
+        with CACHE_LOCK:
+            GITHUB_DATA_CACHE[key] = (commits, truncated)
+    
+    return commits, truncated, complete
 
 '''
 Helper function to format GitHub commits data for the frontend
+Takes the committed_at column (a list of dates), the only one the monthly counts need
 '''
-def format_commits_data(df):
-    if df.empty:
+def format_commits_data(committed_dates):
+    if not committed_dates:
         return []
         
     # Monthly Commits
-    commit_dates = df['committed_at']
-    month_commits = pd.to_datetime(
-        pd.Series(commit_dates), format='%Y-%m-%d')
-    month_commits.index = month_commits.dt.to_period('m')
-    month_commits = month_commits.groupby(level=0).size()
-    month_commits = month_commits.reindex(pd.period_range(
-        month_commits.index.min(), month_commits.index.max(), freq='m'), fill_value=0)
-    month_commits_dict = month_commits.to_dict()
-    commits_data = []
-    for key in month_commits_dict.keys():
-        array = [str(key), month_commits_dict[key]]
-        commits_data.append(array)
+    commits_data = monthly_counts(pd.Series(committed_dates, dtype=object))
         
     return commits_data
 
+# GraphQL query to fetch branches with creation date
+# We're using the date of the branch tip commit as a proxy for branch creation
+BRANCHES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        name
+        target {
+          ... on Commit {
+            committedDate
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 '''
 Helper function to fetch GitHub branches data using GraphQL API
+Returns the branch columns and whether every request succeeded
 '''
 def fetch_github_branches(repo_name, headers):
-    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
-    response_data = []
+    response_data = {'branch_name': [], 'created_at': []}
+    complete = True
     
     # Split repository name
-    owner, name = repo_name.split('/')
+    owner, name = repo_name.split('/', 1)
     
     # Variables for pagination
     has_next_page = True
@@ -218,49 +749,14 @@ def fetch_github_branches(repo_name, headers):
     
     # Retrieve branches with pagination (no limit - fetch all)
     while has_next_page:
-        # Construct the cursor part of the query
-        cursor_string = f', after: "{cursor}"' if cursor else ''
-        
-        # GraphQL query to fetch branches with creation date
-        # We're using the creation date of the first commit as a proxy for branch creation
-        query = """
-        {
-          repository(owner: "%s", name: "%s") {
-            refs(refPrefix: "refs/heads/", first: 100%s) {
-              pageInfo {
-                hasNextPage
-                endCursor
-              }
-              nodes {
-                name
-                target {
-                  ... on Commit {
-                    history(first: 1) {
-                      nodes {
-                        committedDate
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """ % (owner, name, cursor_string)
-        
-        # Make POST request to GitHub GraphQL API
-        graphql_response = requests.post(
-            GITHUB_GRAPHQL_URL,
-            json={"query": query},
-            headers=headers
-        )
-        
-        # Process response
         try:
-            result = graphql_response.json()
+            # Fetch the query from GitHub GraphQL API (or the cache)
+            result = cached_graphql(BRANCHES_QUERY, {"owner": owner, "name": name, "cursor": cursor}, headers)
             
+            # Process response
             if 'errors' in result:
                 print(f"GraphQL Error: {result['errors']}")
+                complete = False
                 break
                 
             refs = result.get('data', {}).get('repository', {}).get('refs', {})
@@ -277,23 +773,13 @@ def fetch_github_branches(repo_name, headers):
             if batch_size == 0:
                 break
             
-            for branch in branches:
-                data = {}
-                # Generate a unique ID for the branch (similar to commit_hash for commits)
-                data['branch_name'] = branch['name']
-                
-                # Get branch creation date from first commit
-                target = branch.get('target', {})
-                history = target.get('history', {}).get('nodes', [])
-                
-                if history and len(history) > 0:
-                    # Format consistent with the commits dates
-                    data['created_at'] = history[0].get('committedDate', '')[:10]
-                else:
-                    # Skip branches with no creation date
-                    continue
-                
-                response_data.append(data)
+            # Get branch creation date from the tip commit, skipping branches with no creation date
+            dated = [(branch['name'], (branch.get('target') or {}).get('committedDate')) for branch in branches]
+            dated = [(branch_name, committed_date) for branch_name, committed_date in dated if committed_date]
+            
+            # Add the page to the columns at once (dates formatted consistent with the commits dates)
+            response_data['branch_name'].extend(branch_name for branch_name, _ in dated)
+            response_data['created_at'].extend(committed_date[:10] for _, committed_date in dated)
                 
             # If we got fewer than 100 branches, there are no more to fetch
             if batch_size < 100:
@@ -301,9 +787,10 @@ def fetch_github_branches(repo_name, headers):
                 
         except Exception as e:
             print(f"Error processing branches: {str(e)}")
+            complete = False
             has_next_page = False
     
-    return response_data
+    return response_data, complete
 
 '''
 Helper function to format GitHub branches data for the frontend
@@ -313,33 +800,50 @@ def format_branches_data(df):
         return []
         
     # Monthly Branches - exactly like monthly commits formatting
-    branch_dates = df['created_at']
-    month_branches = pd.to_datetime(
-        pd.Series(branch_dates), format='%Y-%m-%d')
-    month_branches.index = month_branches.dt.to_period('m')
-    month_branches = month_branches.groupby(level=0).size()
-    month_branches = month_branches.reindex(pd.period_range(
-        month_branches.index.min(), month_branches.index.max(), freq='m'), fill_value=0)
-    month_branches_dict = month_branches.to_dict()
-    branches_data = []
-    for key in month_branches_dict.keys():
-        array = [str(key), month_branches_dict[key]]
-        branches_data.append(array)
+    branches_data = monthly_counts(df['created_at'])
         
     return branches_data
 
+# GraphQL query to fetch commits with author information
+CONTRIBUTORS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String, $since: GitTimestamp!) {
+  repository(owner: $owner, name: $name) {
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $cursor, since: $since) {
+            pageInfo {
+              hasNextPage
+              endCursor
+            }
+            nodes {
+              committedDate
+              author {
+                user {
+                  login
+                }
+                email
+                name
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
 '''
 Helper function to fetch GitHub contributors data using GraphQL API
+Returns the contributor columns and whether every request succeeded
 '''
 def fetch_github_contributors(repo_name, today, headers, months=12):
-    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
-    response_data = []
-    
     # Split repository name
-    owner, name = repo_name.split('/')
+    owner, name = repo_name.split('/', 1)
     
     # Calculate date threshold for the beginning of our search
-    start_date = today + dateutil.relativedelta.relativedelta(months=-months)
+    start_date = month_ranges(today.isoformat(), months)[-1][0]
     start_date_str = start_date.strftime("%Y-%m-%dT%H:%M:%SZ")
     
     # Variables for pagination
@@ -347,57 +851,22 @@ def fetch_github_contributors(repo_name, today, headers, months=12):
     cursor = None
     contributor_count = 0
     
-    # Store all unique contributors with their first contribution date
-    contributor_first_dates = {}
+    # First contribution date of each author, in order of first appearance
+    # (committedDate is ISO-8601 in UTC, so comparing the strings compares the dates)
+    first_dates = {}
+    complete = True
     
     # Retrieve commits with pagination to find contributors
     while has_next_page:
-        # Construct the cursor part of the query
-        cursor_string = f', after: "{cursor}"' if cursor else ''
-        
-        # GraphQL query to fetch commits with author information
-        query = """
-        {
-          repository(owner: "%s", name: "%s") {
-            defaultBranchRef {
-              target {
-                ... on Commit {
-                  history(first: 100%s, since: "%s") {
-                    pageInfo {
-                      hasNextPage
-                      endCursor
-                    }
-                    nodes {
-                      committedDate
-                      author {
-                        user {
-                          login
-                        }
-                        email
-                        name
-                      }
-                    }
-                  }
-                }
-              }
-            }
-          }
-        }
-        """ % (owner, name, cursor_string, start_date_str)
-        
-        # Make POST request to GitHub GraphQL API
-        graphql_response = requests.post(
-            GITHUB_GRAPHQL_URL,
-            json={"query": query},
-            headers=headers
-        )
-        
-        # Process response
         try:
-            result = graphql_response.json()
+            # Fetch the query from GitHub GraphQL API (or the cache)
+            result = cached_graphql(CONTRIBUTORS_QUERY, {"owner": owner, "name": name, "cursor": cursor, "since": start_date_str},
+                                    headers)
             
+            # Process response
             if 'errors' in result:
                 print(f"GraphQL Error: {result['errors']}")
+                complete = False
                 break
                 
             history = result.get('data', {}).get('repository', {}).get('defaultBranchRef', {}).get('target', {}).get('history', {})
@@ -428,11 +897,8 @@ def fetch_github_contributors(repo_name, today, headers, months=12):
                 else:
                     author = 'unknown'
                 
-                # Record the earliest date for each contributor
-                if author and committed_date:
-                    commit_date = datetime.strptime(committed_date, "%Y-%m-%dT%H:%M:%SZ").date()
-                    if author not in contributor_first_dates or commit_date < contributor_first_dates[author]:
-                        contributor_first_dates[author] = commit_date
+                if author and committed_date and (author not in first_dates or committed_date < first_dates[author]):
+                    first_dates[author] = committed_date
             
             # If we got fewer than 100 commits, there are no more to fetch
             if batch_size < 100:
@@ -440,16 +906,16 @@ def fetch_github_contributors(repo_name, today, headers, months=12):
                 
         except Exception as e:
             print(f"Error processing contributors: {str(e)}")
+            complete = False
             has_next_page = False
     
-    # Convert the contributor data to the expected format
-    for author, first_date in contributor_first_dates.items():
-        data = {}
-        data['contributor_name'] = author
-        data['first_contribution_date'] = first_date.strftime("%Y-%m-%d")
-        response_data.append(data)
+    # Convert the contributor data to the expected columns
+    response_data = {
+        'contributor_name': list(first_dates),
+        'first_contribution_date': [committed_date[:10] for committed_date in first_dates.values()]
+    }
     
-    return response_data
+    return response_data, complete
 
 '''
 Helper function to format GitHub contributors data for the frontend
@@ -459,58 +925,65 @@ def format_contributors_data(df):
         return []
     
     # Monthly new contributors
-    contribution_dates = df['first_contribution_date']
-    month_contributors = pd.to_datetime(
-        pd.Series(contribution_dates), format='%Y-%m-%d')
-    month_contributors.index = month_contributors.dt.to_period('m')
-    month_contributors = month_contributors.groupby(level=0).size()
-    month_contributors = month_contributors.reindex(pd.period_range(
-        month_contributors.index.min(), month_contributors.index.max(), freq='m'), fill_value=0)
-    month_contributors_dict = month_contributors.to_dict()
-    contributors_data = []
-    for key in month_contributors_dict.keys():
-        array = [str(key), month_contributors_dict[key]]
-        contributors_data.append(array)
+    contributors_data = monthly_counts(df['first_contribution_date'])
     
     return contributors_data
 
+# GraphQL query to check whether a repository has releases
+RELEASES_COUNT_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    releases(first: 1) {
+      totalCount
+    }
+  }
+}
+"""
+
+# GraphQL query to fetch releases with publication date
+RELEASES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    releases(first: 100, after: $cursor, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {
+        name
+        tagName
+        createdAt
+        publishedAt
+        isPrerelease
+        isDraft
+      }
+    }
+  }
+}
+"""
+
 '''
 Helper function to fetch GitHub releases data using GraphQL API
+Returns the releases and whether every request succeeded (a repository without releases is complete)
 '''
 def fetch_github_releases(repo_name, headers):
-    GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
     response_data = []
+    complete = True
     
     try:
         # Split repository name
-        owner, name = repo_name.split('/')
+        owner, name = repo_name.split('/', 1)
         
         print(f"Fetching releases for {owner}/{name}")
         
         # First check if the repository exists and has releases using a simpler query
-        check_query = """
-        {
-          repository(owner: "%s", name: "%s") {
-            releases(first: 1) {
-              totalCount
-            }
-          }
-        }
-        """ % (owner, name)
-        
-        # Make POST request to GitHub GraphQL API
-        check_response = requests.post(
-            GITHUB_GRAPHQL_URL,
-            json={"query": check_query},
-            headers=headers
-        )
-        
-        check_result = check_response.json()
+        # Fetch the query from GitHub GraphQL API (or the cache)
+        check_result = cached_graphql(RELEASES_COUNT_QUERY, {"owner": owner, "name": name}, headers)
         
         # Check if repository has releases
         if 'errors' in check_result:
             print(f"GraphQL Error checking releases: {check_result['errors']}")
-            return []
+            return [], False
         
         try:
             total_releases = check_result.get('data', {}).get('repository', {}).get('releases', {}).get('totalCount', 0)
@@ -518,10 +991,10 @@ def fetch_github_releases(repo_name, headers):
             
             if total_releases == 0:
                 print("No releases found for this repository")
-                return []
+                return [], True
         except Exception as e:
             print(f"Error checking release count: {str(e)}")
-            return []
+            return [], False
         
         # Variables for pagination
         has_next_page = True
@@ -530,44 +1003,14 @@ def fetch_github_releases(repo_name, headers):
         
         # Retrieve releases with pagination (no limit - fetch all)
         while has_next_page:
-            # Construct the cursor part of the query
-            cursor_string = f', after: "{cursor}"' if cursor else ''
-            
-            # GraphQL query to fetch releases with publication date
-            query = """
-            {
-              repository(owner: "%s", name: "%s") {
-                releases(first: 100%s, orderBy: {field: CREATED_AT, direction: DESC}) {
-                  pageInfo {
-                    hasNextPage
-                    endCursor
-                  }
-                  nodes {
-                    name
-                    tagName
-                    createdAt
-                    publishedAt
-                    isPrerelease
-                    isDraft
-                  }
-                }
-              }
-            }
-            """ % (owner, name, cursor_string)
-            
-            # Make POST request to GitHub GraphQL API
-            graphql_response = requests.post(
-                GITHUB_GRAPHQL_URL,
-                json={"query": query},
-                headers=headers
-            )
+            # Fetch the query from GitHub GraphQL API (or the cache)
+            result = cached_graphql(RELEASES_QUERY, {"owner": owner, "name": name, "cursor": cursor}, headers)
             
             # Process response
             try:
-                result = graphql_response.json()
-                
                 if 'errors' in result:
                     print(f"GraphQL Error: {result['errors']}")
+                    complete = False
                     break
                     
                 releases = result.get('data', {}).get('repository', {}).get('releases', {})
@@ -586,21 +1029,15 @@ def fetch_github_releases(repo_name, headers):
                 if batch_size == 0:
                     break
                 
-                for release in release_nodes:
-                    data = {}
-                    data['release_name'] = release.get('name', '')
-                    data['tag_name'] = release.get('tagName', '')
-                    
-                    # Use publishedAt if available, otherwise use createdAt
-                    if release.get('publishedAt'):
-                        data['created_at'] = release.get('publishedAt', '')[:10]  # Just keep the date part
-                    else:
-                        data['created_at'] = release.get('createdAt', '')[:10]  # Just keep the date part
-                    
-                    data['is_prerelease'] = release.get('isPrerelease', False)
-                    data['is_draft'] = release.get('isDraft', False)
-                    
-                    response_data.append(data)
+                # Add the page at once
+                # (use publishedAt if available, otherwise use createdAt, and just keep the date part)
+                response_data.extend({
+                    'release_name': release.get('name', ''),
+                    'tag_name': release.get('tagName', ''),
+                    'created_at': (release.get('publishedAt') or release.get('createdAt') or '')[:10],
+                    'is_prerelease': release.get('isPrerelease', False),
+                    'is_draft': release.get('isDraft', False),
+                } for release in release_nodes)
                     
                 # If we got fewer than 100 releases, there are no more to fetch
                 if batch_size < 100:
@@ -608,668 +1045,802 @@ def fetch_github_releases(repo_name, headers):
                     
             except Exception as e:
                 print(f"Error processing releases batch: {str(e)}")
+                complete = False
                 has_next_page = False
         
         print(f"Successfully fetched {release_count} releases for {owner}/{name}")
         
     except Exception as e:
         print(f"Error in fetch_github_releases: {str(e)}")
+        complete = False
     
-    return response_data
-
-# Add a new function to handle the case where the DataFrame is empty or has no valid dates
-def safe_format_releases_data(df):
-    try:
-        if df.empty:
-            print("Releases DataFrame is empty")
-            return []
-            
-        if 'created_at' not in df.columns:
-            print("No 'created_at' column in releases DataFrame")
-            return []
-            
-        # Check for null or empty created_at values
-        df = df.dropna(subset=['created_at'])
-        
-        if df.empty:
-            print("No valid dates in releases DataFrame after dropping NAs")
-            return []
-            
-        # Monthly Releases - exactly like monthly commits formatting
-        release_dates = df['created_at']
-        
-        # Debug information
-        print(f"Release dates: {release_dates.tolist()}")
-        
-        month_releases = pd.to_datetime(
-            pd.Series(release_dates), format='%Y-%m-%d', errors='coerce')
-            
-        # Check if we have valid dates after conversion
-        invalid_dates = month_releases.isna().sum()
-        if invalid_dates > 0:
-            print(f"Warning: {invalid_dates} invalid dates found and will be dropped")
-            month_releases = month_releases.dropna()
-            
-        if len(month_releases) == 0:
-            print("No valid dates after conversion")
-            return []
-            
-        month_releases.index = month_releases.dt.to_period('m')
-        month_releases = month_releases.groupby(level=0).size()
-        
-        if len(month_releases) == 0:
-            print("No releases after grouping by month")
-            return []
-            
-        month_releases = month_releases.reindex(pd.period_range(
-            month_releases.index.min(), month_releases.index.max(), freq='m'), fill_value=0)
-        month_releases_dict = month_releases.to_dict()
-        releases_data = []
-        for key in month_releases_dict.keys():
-            array = [str(key), month_releases_dict[key]]
-            releases_data.append(array)
-            
-        print(f"Formatted {len(releases_data)} months of release data")
-        return releases_data
-        
-    except Exception as e:
-        print(f"Error in format_releases_data: {str(e)}")
-        return []
+    return response_data, complete
 
 '''
-API route path is  "/api/github"
-This API will accept only POST request
+Helper function to build the issues part of the /api/github response
+Monthly created and closed issues, then the forecast of each
+(a single request for both with BATCH_LSTM, otherwise two requests sent side by side)
 '''
-@app.route('/api/github', methods=['POST'])
-def github():
-    body = request.get_json()
-    # Extract the choosen repositories from the request
-    repo_name = body['repository']
-    # Extract the data type from the request (issues, pulls, commits, branches, releases)
-    data_type = body.get('dataType', 'issues')  # Default to issues if not specified
-    # Extract the model type from the request (lstm, statsmodel, or prophet)
-    model_type = body.get('modelType', 'lstm')  # Default to lstm if not specified
+def build_issues_data(repo_name, today, headers, forecast_api_url):
+    # Fetch and process only issues data
+    df_issues, fetched = get_github_data(repo_name, today, headers, 'issue')
     
-    # Add your own GitHub Token to run it local
-    token = os.environ.get(
-        'GITHUB_TOKEN', 'YOUR_GITHUB_TOKEN')
-    GITHUB_URL = f"https://api.github.com/"
-    headers = {
-        "Authorization": f'token {token}'
-    }
-    params = {
-        "state": "all"  # Get all issues/PRs regardless of state
-    }
-    repository_url = GITHUB_URL + "repos/" + repo_name
-    # Fetch GitHub data from GitHub API
-    repository = requests.get(repository_url, headers=headers)
-    # Convert the data obtained from GitHub API to JSON format
-    repository = repository.json()
-
-    today = date.today()
+    # Format issues data for frontend
+    created_at_issues, closed_at_issues = format_github_data(df_issues, today)
     
-    # Initialize response data
-    created_at_issues = []
-    closed_at_issues = []
-    pulls_data = []
-    commits_data = []
-    branches_data = []
-    contributors_data = []
-    releases_data = []
-    created_at_image_urls = {}
-    closed_at_image_urls = {}
-    pulls_image_urls = {}
-    commits_image_urls = {}
-    branches_image_urls = {}
-    contributors_image_urls = {}
-    releases_image_urls = {}
-
-    # Check if we're in development environment
-    IS_DEV_ENV = os.environ.get('FLASK_ENV', '') == 'development'
-    
-    # Choose endpoint based on model type and use local service in dev environment, otherwise use cloud URL
-    if model_type == 'lstm':
-        if IS_DEV_ENV:
-            FORECAST_API_URL = "http://lstm-service:8080/forecast-lstm"
-        else:
-            # Update your Google cloud deployed LSTM app URL (NOTE: DO NOT REMOVE "/")
-            FORECAST_API_URL = os.environ.get("LSTM_API_URL", "https://forecast-service-852131999673.us-central1.run.app/") + "forecast-lstm"
-    elif model_type == 'statsmodel':
-        if IS_DEV_ENV:
-            FORECAST_API_URL = "http://lstm-service:8080/forecast-statsmodel"
-        else:
-            # Update your Google cloud deployed LSTM app URL (NOTE: DO NOT REMOVE "/")
-            FORECAST_API_URL = os.environ.get("LSTM_API_URL", "https://forecast-service-852131999673.us-central1.run.app/") + "forecast-statsmodel"
-    else:  # prophet
-        if IS_DEV_ENV:
-            FORECAST_API_URL = "http://lstm-service:8080/forecast-prophet"
-        else:
-            # Update your Google cloud deployed LSTM app URL (NOTE: DO NOT REMOVE "/")
-            FORECAST_API_URL = os.environ.get("LSTM_API_URL", "https://forecast-service-852131999673.us-central1.run.app/") + "forecast-prophet"
+    # Convert issues data to records for the forecasting service
+    issues_response = df_issues.to_dict('records')
+    forecast_repo = repo_name.split("/", 1)[1]
     
-    # Process based on data type requested
-    if data_type == 'issues':
-        # Fetch and process only issues data
-        issues_response = fetch_github_data(repo_name, today, headers, params, 'issue')
-        
-        # Process issues data
-        df_issues = pd.DataFrame(issues_response)
-        
-        # Format issues data for frontend
-        created_at_issues, closed_at_issues = format_github_data(df_issues) if not df_issues.empty else ([], [])
-        
+    # The charts go out before waiting on the forecasts
+    yield {"created": created_at_issues, "closed": closed_at_issues}, fetched
+    
+    complete = True
+    if BATCH_LSTM:
+        # One request for both forecasts, the issues are uploaded once
+        issues_body = {
+            "issues": issues_response,
+            "types": ["created_at", "closed_at"],
+            "repo": forecast_repo
+        }
+        try:
+            issues_forecast = post_forecast(forecast_api_url, issues_body)
+    
+            # The response holds the image URLs of the created and closed issues (see BATCH_LSTM)
+            created_at_image_urls = issues_forecast["created"]
+            closed_at_image_urls = issues_forecast["closed"]
+        except Exception as e:
+            print(f"Error getting issues forecasts: {str(e)}")
+            # No forecast images (the same for every model type)
+            created_at_image_urls = dict(EMPTY_IMAGE_URLS)
+            closed_at_image_urls = dict(EMPTY_IMAGE_URLS)
+            complete = False
+    else:
         # Prepare data for forecasting
         created_at_body = {
             "issues": issues_response,
             "type": "created_at",
-            "repo": repo_name.split("/")[1]
+            "repo": forecast_repo
         }
         closed_at_body = {
             "issues": issues_response,
             "type": "closed_at",
-            "repo": repo_name.split("/")[1]
-        }
-        
-        # Get forecasts for created issues
-        created_at_response = requests.post(FORECAST_API_URL,
-                                           json=created_at_body,
-                                           headers={'content-type': 'application/json'})
-        
-        # Get forecasts for closed issues
-        closed_at_response = requests.post(FORECAST_API_URL,
-                                         json=closed_at_body,
-                                         headers={'content-type': 'application/json'})
-                                         
-        # Store responses                                 
-        created_at_image_urls = created_at_response.json()
-        closed_at_image_urls = closed_at_response.json()
-        
-    elif data_type == 'pulls':
-        # Fetch and process only pull requests data
-        pulls_response = fetch_github_data(repo_name, today, headers, params, 'pr')
-        
-        # Process pull requests data
-        df_pulls = pd.DataFrame(pulls_response)
-        
-        # Format pull requests data for frontend
-        pulls_data = format_pulls_data(df_pulls) if not df_pulls.empty else []
-        
-        # For pull requests, modify the data structure for forecasting service compatibility
-        pulls_for_lstm = []
-        for pull in pulls_response:
-            pull_modified = pull.copy()
-            pull_modified['created_at'] = pull['created_at']
-            pulls_for_lstm.append(pull_modified)
-        
-        pulls_body = {
-            "issues": pulls_for_lstm,
-            "type": "created_at",
-            "repo": repo_name.split("/")[1] + "_pulls"
+            "repo": forecast_repo
         }
+    
+        # Get forecasts for created and closed issues concurrently
+        created_at_future = FORECAST_EXECUTOR.submit(post_forecast, forecast_api_url, created_at_body)
+        closed_at_future = FORECAST_EXECUTOR.submit(post_forecast, forecast_api_url, closed_at_body)
         
-        # Get forecasts for pull requests
+        # Store responses, a failed forecast leaves the other one in place
         try:
-            pulls_response_forecast = requests.post(FORECAST_API_URL,
-                                                  json=pulls_body,
-                                                  headers={'content-type': 'application/json'})
-            pulls_image_urls = pulls_response_forecast.json()
+            created_at_image_urls = created_at_future.result()
         except Exception as e:
-            print(f"Error getting pull request forecasts: {str(e)}")
-            # Set default image URLs based on model type
-            if model_type == 'lstm':
-                pulls_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-            else:  # statsmodel or prophet
-                pulls_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-    
-    elif data_type == 'commits':
-        # Fetch and process commits data using GraphQL API
-        commits_response = fetch_github_commits(repo_name, today, headers)
-        
-        # Process commits data
-        df_commits = pd.DataFrame(commits_response)
-        
-        # Format commits data for frontend
-        commits_data = format_commits_data(df_commits) if not df_commits.empty else []
-        
-        # Prepare data for forecasting service
-        commits_for_forecast = []
-        for commit in commits_response:
-            commit_modified = {}
-            commit_modified['issue_number'] = commit['commit_hash'][:8]  # Use first 8 chars of hash as ID
-            commit_modified['created_at'] = commit['committed_at']  # Use commit date
-            commits_for_forecast.append(commit_modified)
-        
-        commits_body = {
-            "issues": commits_for_forecast,
-            "type": "created_at",
-            "repo": repo_name.split("/")[1] + "_commits"
-        }
-        
-        # Get forecasts for commits
+            print(f"Error getting created issues forecasts: {str(e)}")
+            created_at_image_urls = dict(EMPTY_IMAGE_URLS)
+            complete = False
         try:
-            commits_response_forecast = requests.post(FORECAST_API_URL,
-                                                    json=commits_body,
-                                                    headers={'content-type': 'application/json'})
-            commits_image_urls = commits_response_forecast.json()
+            closed_at_image_urls = closed_at_future.result()
         except Exception as e:
-            print(f"Error getting commits forecasts: {str(e)}")
-            # Set default image URLs based on model type
-            if model_type == 'lstm':
-                commits_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-            else:  # statsmodel or prophet
-                commits_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
+            print(f"Error getting closed issues forecasts: {str(e)}")
+            closed_at_image_urls = dict(EMPTY_IMAGE_URLS)
+            complete = False
+    
+    yield {"createdAtImageUrls": created_at_image_urls, "closedAtImageUrls": closed_at_image_urls}, complete
+
+'''
+Helper function to build the pull requests part of the /api/github response
+Monthly pull requests, forecast like created issues
+'''
+def build_pulls_data(repo_name, today, headers, forecast_api_url):
+    # Fetch and process only pull requests data
+    df_pulls, fetched = get_github_data(repo_name, today, headers, 'pr')
+    
+    # Format pull requests data for frontend
+    pulls_data = format_pulls_data(df_pulls)
+    
+    # Convert pull requests data to records for the forecasting service
+    pulls_response = df_pulls.to_dict('records')
+    
+    # Pull requests already have the created_at field the forecasting service expects
+    pulls_body = {
+        "issues": pulls_response,
+        "type": "created_at",
+        "repo": repo_name.split("/", 1)[1] + "_pulls"
+    }
+    
+    yield {"pulls": pulls_data}, fetched
+    
+    complete = True
+    # Get forecasts for pull requests
+    try:
+        pulls_image_urls = post_forecast(forecast_api_url, pulls_body)
+    except Exception as e:
+        print(f"Error getting pull request forecasts: {str(e)}")
+        complete = False
+        # No forecast images (the same for every model type)
+        pulls_image_urls = dict(EMPTY_IMAGE_URLS)
+    
+    yield {"pullsImageUrls": pulls_image_urls}, complete
+
+'''
+Helper function to build the commits part of the /api/github response
+Monthly commits and whether some months were cut off at MAX_PAGES_PER_MONTH, then their forecast
+'''
+def build_commits_data(repo_name, today, headers, forecast_api_url):
+    # Fetch and process commits data using GraphQL API
+    commits_response, commits_truncated, fetched = fetch_github_commits(repo_name, today, headers)
+    
+    # Format commits data for frontend (only the dates are needed, so no DataFrame of all the columns is built)
+    commits_data = format_commits_data(commits_response['committed_at'])
+    
+    # Prepare data for forecasting service
+    # (first 8 chars of the hash as ID, commit date as creation date)
+    commits_for_forecast = [{'issue_number': commit_hash[:8], 'created_at': committed_at}
+                            for commit_hash, committed_at in zip(commits_response['commit_hash'], commits_response['committed_at'])]
+    
+    commits_body = {
+        "issues": commits_for_forecast,
+        "type": "created_at",
+        "repo": repo_name.split("/", 1)[1] + "_commits"
+    }
+    
+    yield {"commits": commits_data, "commitsTruncated": commits_truncated}, fetched
+    
+    complete = True
+    # Get forecasts for commits
+    try:
+        commits_image_urls = post_forecast(forecast_api_url, commits_body)
+    except Exception as e:
+        print(f"Error getting commits forecasts: {str(e)}")
+        complete = False
+        # No forecast images (the same for every model type)
+        commits_image_urls = dict(EMPTY_IMAGE_URLS)
+    
+    yield {"commitsImageUrls": commits_image_urls}, complete
+
+'''
+Helper function to build the branches part of the /api/github response
+Monthly branches by the date of their tip commit, then their forecast
+'''
+def build_branches_data(repo_name, today, headers, forecast_api_url):
+    # Fetch and process branches data using GraphQL API
+    branches_response, fetched = fetch_github_branches(repo_name, headers)
+    
+    # Process branches data
+    df_branches = pd.DataFrame(branches_response, copy=False)
+    
+    # Format branches data for frontend
+    branches_data = format_branches_data(df_branches)
+    
+    # Prepare data for forecasting service - structure exactly like commits
+    # (branch name as ID, creation date)
+    branches_for_forecast = [{'issue_number': branch_name[:8], 'created_at': created_at}
+                             for branch_name, created_at in zip(branches_response['branch_name'], branches_response['created_at'])]
+    
+    # Removed 50-point limitation: Always attempt forecasting regardless of data size
+    branches_body = {
+        "issues": branches_for_forecast,
+        "type": "created_at",
+        "repo": repo_name.split("/", 1)[1] + "_branches"
+    }
+    
+    yield {"branches": branches_data}, fetched
+    
+    complete = True
+    # Get forecasts for branches
+    try:
+        branches_image_urls = post_forecast(forecast_api_url, branches_body)
+    except Exception as e:
+        print(f"Error getting branches forecasts: {str(e)}")
+        complete = False
+        # No forecast images (the same for every model type)
+        branches_image_urls = dict(EMPTY_IMAGE_URLS)
+    
+    yield {"branchesImageUrls": branches_image_urls}, complete
+
+'''
+Helper function to build the contributors part of the /api/github response
+Monthly new contributors by their first commit in the period, then their forecast
+'''
+def build_contributors_data(repo_name, today, headers, forecast_api_url):
+    # Fetch and process contributors data using GraphQL API
+    contributors_response, fetched = fetch_github_contributors(repo_name, today, headers)
+    
+    # Process contributors data
+    df_contributors = pd.DataFrame(contributors_response, copy=False)
+    
+    # Format contributors data for frontend
+    contributors_data = format_contributors_data(df_contributors)
+    
+    # Prepare data for forecasting service
+    # (first 8 chars of the name as ID, first contribution date as creation date)
+    contributors_for_forecast = [{'issue_number': contributor_name[:8], 'created_at': first_contribution_date}
+                                 for contributor_name, first_contribution_date in zip(contributors_response['contributor_name'],
+                                                                                      contributors_response['first_contribution_date'])]
+    
+    contributors_body = {
+        "issues": contributors_for_forecast,
+        "type": "created_at",
+        "repo": repo_name.split("/", 1)[1] + "_contributors"
+    }
+    
+    yield {"contributors": contributors_data}, fetched
+    
+    complete = True
+    # Get forecasts for contributors
+    try:
+        contributors_image_urls = post_forecast(forecast_api_url, contributors_body)
+    except Exception as e:
+        print(f"Error getting contributors forecasts: {str(e)}")
+        complete = False
+        # No forecast images (the same for every model type)
+        contributors_image_urls = dict(EMPTY_IMAGE_URLS)
+    
+    yield {"contributorsImageUrls": contributors_image_urls}, complete
+
+'''
+Helper function to build the releases part of the /api/github response
+Monthly releases, then their forecast (only with at least 5 releases, otherwise empty images)
+'''
+def build_releases_data(repo_name, today, headers, forecast_api_url):
+    releases_data = []
+    complete = True
+    try:
+        print(f"Processing releases data for {repo_name}")
+    
+        # Fetch and process releases data using GraphQL API
+        releases_response, fetched = fetch_github_releases(repo_name, headers)
+        print(f"Fetched {len(releases_response)} releases")
+    
+        # Format releases data for frontend directly from the response
+        if releases_response:
+            # Format similar to branches & contributors
+            release_dates = [release.get('created_at', '') for release in releases_response if release.get('created_at', '')]
+            if release_dates:
+                try:
+                    month_releases = pd.to_datetime(pd.Series(release_dates), format='%Y-%m-%d', errors='coerce')
+                    month_releases = month_releases.dropna()  # Remove invalid dates
+    
+                    if not month_releases.empty:
+                        releases_data = monthly_counts(month_releases)
+    
+                        print(f"Formatted {len(releases_data)} months of release data")
+                    else:
+                        print("No valid dates after conversion")
+                except Exception as e:
+                    print(f"Error formatting releases data: {str(e)}")
+        else:
+            print("No releases data to format")
+    
+        yield {"releases": releases_data}, fetched
+    
+        # Prepare data for forecasting service (only if we have releases)
+        if releases_response:
+            # Create data for forecasting
+            releases_for_forecast = []
+            for release in releases_response:
+                try:
+                    release_modified = {}
+                    tag_name = release.get('tag_name', '')
+                    if not tag_name:
+                        tag_name = release.get('release_name', f"release_{len(releases_for_forecast)}")
+    
+                    release_modified['issue_number'] = tag_name[:8] if len(tag_name) > 8 else tag_name
+    
+                    created_at = release.get('created_at', '')
+                    if not created_at:
+                        continue  # Skip releases without dates
+    
+                    release_modified['created_at'] = created_at
+                    releases_for_forecast.append(release_modified)
+                except Exception as e:
+                    print(f"Error processing release for forecast: {str(e)}")
+    
+            print(f"Prepared {len(releases_for_forecast)} releases for forecasting")
+    
+            # Only attempt forecast if we have enough data
+            if len(releases_for_forecast) >= 5:  # Minimum data points for meaningful forecast
+                releases_body = {
+                    "issues": releases_for_forecast,
+                    "type": "created_at",
+                    "repo": repo_name.split("/", 1)[1] + "_releases"
                 }
-                
-    elif data_type == 'branches':
-        # Fetch and process branches data using GraphQL API
-        branches_response = fetch_github_branches(repo_name, headers)
-        
-        # Process branches data
-        df_branches = pd.DataFrame(branches_response)
-        
-        # Format branches data for frontend
-        branches_data = format_branches_data(df_branches) if not df_branches.empty else []
-        
-        # Prepare data for forecasting service - structure exactly like commits
-        branches_for_forecast = []
-        for branch in branches_response:
-            branch_modified = {}
-            branch_modified['issue_number'] = branch['branch_name'][:8] if len(branch['branch_name']) > 8 else branch['branch_name']  # Use branch name as ID
-            branch_modified['created_at'] = branch['created_at']  # Use creation date
-            branches_for_forecast.append(branch_modified)
-        
-        # Removed 50-point limitation: Always attempt forecasting regardless of data size
-        branches_body = {
-            "issues": branches_for_forecast,
-            "type": "created_at",
-            "repo": repo_name.split("/")[1] + "_branches"
-        }
-        
-        # Get forecasts for branches
-        try:
-            branches_response_forecast = requests.post(FORECAST_API_URL,
-                                                    json=branches_body,
-                                                    headers={'content-type': 'application/json'})
-            if branches_response_forecast.status_code == 200:
+    
+                # Get forecasts for releases
                 try:
-                    branches_image_urls = branches_response_forecast.json()
-                except:
-                    print("Error decoding JSON from LSTM service for branches")
-                    branches_image_urls = {
-                        "model_loss_image_url": "",
-                        "lstm_generated_image_url": "",
-                        "all_issues_data_image": ""
-                    }
+                    print(f"Sending forecast request to {forecast_api_url}")
+                    releases_image_urls = post_forecast(forecast_api_url, releases_body, timeout=30)
+                    print("Successfully received forecast images")
+                except Exception as e:
+                    print(f"Error getting releases forecasts: {str(e)}")
+                    releases_image_urls = dict(EMPTY_IMAGE_URLS)
+                    complete = False
             else:
-                branches_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-        except Exception as e:
-            print(f"Error getting branches forecasts: {str(e)}")
-            # Set default image URLs based on model type
-            branches_image_urls = {
-                "model_loss_image_url": "",
-                "lstm_generated_image_url": "",
-                "all_issues_data_image": ""
-            }
+                print(f"Not enough release data for forecasting (need 5, have {len(releases_for_forecast)})")
+                releases_image_urls = dict(EMPTY_IMAGE_URLS)
+        else:
+            print("No releases data for forecasting")
+            releases_image_urls = dict(EMPTY_IMAGE_URLS)
+    except Exception as e:
+        print(f"Error in releases processing: {str(e)}")
+        # The chart data is sent again with the fallback, in case it failed before going out
+        yield {"releases": releases_data, "releasesImageUrls": dict(EMPTY_IMAGE_URLS)}, False
+        return
+    
+    yield {"releasesImageUrls": releases_image_urls}, complete
 
-    elif data_type == 'contributors':
-        # Fetch and process contributors data using GraphQL API
-        contributors_response = fetch_github_contributors(repo_name, today, headers)
-        
-        # Process contributors data
-        df_contributors = pd.DataFrame(contributors_response)
-        
-        # Format contributors data for frontend
-        contributors_data = format_contributors_data(df_contributors) if not df_contributors.empty else []
-        
-        # Prepare data for forecasting service
-        contributors_for_forecast = []
-        for contributor in contributors_response:
-            contrib_modified = {}
-            contrib_modified['issue_number'] = contributor.get('contributor_name', 'unknown')[:8]  # Use first 8 chars of name as ID
-            contrib_modified['created_at'] = contributor.get('first_contribution_date')  # Use first contribution date
-            contributors_for_forecast.append(contrib_modified)
-        
-        contributors_body = {
-            "issues": contributors_for_forecast,
-            "type": "created_at",
-            "repo": repo_name.split("/")[1] + "_contributors"
-        }
-        
-        # Get forecasts for contributors
-        try:
-            contributors_response_forecast = requests.post(FORECAST_API_URL,
-                                                    json=contributors_body,
-                                                    headers={'content-type': 'application/json'})
-            contributors_image_urls = contributors_response_forecast.json()
-        except Exception as e:
-            print(f"Error getting contributors forecasts: {str(e)}")
-            # Set default image URLs based on model type
-            if model_type == 'lstm':
-                contributors_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-            else:  # statsmodel or prophet
-                contributors_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
+# Builders of the response parts of each data type, called with (repo_name, today, headers, forecast_api_url)
+# Each builder is a generator of (part, complete) pairs: first the chart data as soon as it is formatted,
+# then the forecast image URLs once they are back, so the charts don't wait on the forecasting service
+# A part is complete when every GitHub request succeeded (chart data) or no forecast failed (image URLs),
+# responses with an incomplete part are not cached
+DATA_TYPE_BUILDERS = {
+    'issues': build_issues_data,
+    'pulls': build_pulls_data,
+    'commits': build_commits_data,
+    'branches': build_branches_data,
+    'contributors': build_contributors_data,
+    'releases': build_releases_data,
+}
 
-    elif data_type == 'releases':
-        try:
-            print(f"Processing releases data for {repo_name}")
-            
-            # Fetch and process releases data using GraphQL API
-            releases_response = fetch_github_releases(repo_name, headers)
-            print(f"Fetched {len(releases_response)} releases")
-            
-            # Format releases data for frontend directly from the response
-            releases_data = []
-            
-            if releases_response:
-                # Format similar to branches & contributors
-                release_dates = [release.get('created_at', '') for release in releases_response if release.get('created_at', '')]
-                if release_dates:
-                    try:
-                        month_releases = pd.to_datetime(pd.Series(release_dates), format='%Y-%m-%d', errors='coerce')
-                        month_releases = month_releases.dropna()  # Remove invalid dates
-                        
-                        if not month_releases.empty:
-                            month_releases.index = month_releases.dt.to_period('m')
-                            month_releases = month_releases.groupby(level=0).size()
-                            month_releases = month_releases.reindex(pd.period_range(
-                                month_releases.index.min(), month_releases.index.max(), freq='m'), fill_value=0)
-                            month_releases_dict = month_releases.to_dict()
-                            
-                            for key in month_releases_dict.keys():
-                                array = [str(key), month_releases_dict[key]]
-                                releases_data.append(array)
-                            
-                            print(f"Formatted {len(releases_data)} months of release data")
-                        else:
-                            print("No valid dates after conversion")
-                    except Exception as e:
-                        print(f"Error formatting releases data: {str(e)}")
-            else:
-                print("No releases data to format")
+'''
+Helper function to run a builder of a (not streamed) /api/github response
+Returns the list of all its parts, once the forecasts are done too
+'''
+def collect_builder_parts(build_data, builder_args):
+    return list(build_data(*builder_args))
+
+'''
+Helper function to run a builder of a streamed /api/github response in its own thread
+Puts every part on the queue as soon as it is built, then None once the builder is done
+(a builder that fails puts an error part, the stream goes on with the other data types)
+'''
+def queue_builder_parts(parts, data_type_name, build_data, builder_args):
+    try:
+        for part, part_complete in build_data(*builder_args):
+            parts.put((part, part_complete))
+    except Exception as e:
+        print(f"Error building {data_type_name} data: {str(e)}")
+        parts.put(({"error": f"Error building {data_type_name} data"}, False))
+    finally:
+        parts.put(None)
+
+'''
+Helper function to generate the lines of a streamed (NDJSON) /api/github response
+Each line is a JSON object whose keys update the response: the first one holds the empty data and the
+repository counts, then every part of the builders (see DATA_TYPE_BUILDERS) follows as soon as it is built
+(a data type that fails gets an "error" line instead); the response is cached once every part is complete
+'''
+def stream_github_response(json_response, builders, builder_args, response_key):
+    yield orjson.dumps(json_response, default=orjson_default, option=ORJSON_OPTIONS) + b"\n"
+    
+    complete = True
+    if builders:
+        # The builders run in their own threads and put their parts on the queue as they are ready
+        parts = queue.Queue()
+        with ThreadPoolExecutor(max_workers=len(builders)) as executor:
+            for data_type_name, build_data in builders.items():
+                executor.submit(queue_builder_parts, parts, data_type_name, build_data, builder_args)
             
-            # Prepare data for forecasting service (only if we have releases)
-            if releases_response:
-                # Create data for forecasting
-                releases_for_forecast = []
-                for release in releases_response:
-                    try:
-                        release_modified = {}
-                        tag_name = release.get('tag_name', '')
-                        if not tag_name:
-                            tag_name = release.get('release_name', f"release_{len(releases_for_forecast)}")
-                        
-                        release_modified['issue_number'] = tag_name[:8] if len(tag_name) > 8 else tag_name
-                        
-                        created_at = release.get('created_at', '')
-                        if not created_at:
-                            continue  # Skip releases without dates
-                            
-                        release_modified['created_at'] = created_at
-                        releases_for_forecast.append(release_modified)
-                    except Exception as e:
-                        print(f"Error processing release for forecast: {str(e)}")
-                
-                print(f"Prepared {len(releases_for_forecast)} releases for forecasting")
-                
-                # Only attempt forecast if we have enough data
-                if len(releases_for_forecast) >= 5:  # Minimum data points for meaningful forecast
-                    releases_body = {
-                        "issues": releases_for_forecast,
-                        "type": "created_at",
-                        "repo": repo_name.split("/")[1] + "_releases"
-                    }
-                    
-                    # Get forecasts for releases
-                    try:
-                        print(f"Sending forecast request to {FORECAST_API_URL}")
-                        releases_response_forecast = requests.post(
-                            FORECAST_API_URL,
-                            json=releases_body,
-                            headers={'content-type': 'application/json'},
-                            timeout=30
-                        )
-                        
-                        if releases_response_forecast.status_code == 200:
-                            releases_image_urls = releases_response_forecast.json()
-                            print("Successfully received forecast images")
-                        else:
-                            print(f"Error response from forecast service: {releases_response_forecast.status_code}")
-                            # Set default image URLs
-                            releases_image_urls = {
-                                "model_loss_image_url": "",
-                                "lstm_generated_image_url": "",
-                                "all_issues_data_image": ""
-                            }
-                    except Exception as e:
-                        print(f"Error getting releases forecasts: {str(e)}")
-                        releases_image_urls = {
-                            "model_loss_image_url": "",
-                            "lstm_generated_image_url": "",
-                            "all_issues_data_image": ""
-                        }
-                else:
-                    print(f"Not enough release data for forecasting (need 5, have {len(releases_for_forecast)})")
-                    releases_image_urls = {
-                        "model_loss_image_url": "",
-                        "lstm_generated_image_url": "",
-                        "all_issues_data_image": ""
-                    }
-            else:
-                print("No releases data for forecasting")
-                releases_image_urls = {
-                    "model_loss_image_url": "",
-                    "lstm_generated_image_url": "",
-                    "all_issues_data_image": ""
-                }
-        except Exception as e:
-            print(f"Error in releases processing: {str(e)}")
-            releases_data = []
-            releases_image_urls = {
-                "model_loss_image_url": "",
-                "lstm_generated_image_url": "",
-                "all_issues_data_image": ""
-            }
+            running = len(builders)
+            while running:
+                item = parts.get()
+                # None marks a builder that is done
+                if item is None:
+                    running -= 1
+                    continue
+                part, part_complete = item
+                if "error" not in part:
+                    json_response.update(part)
+                complete = complete and part_complete
+                yield orjson.dumps(part, default=orjson_default, option=ORJSON_OPTIONS) + b"\n"
+    
+    # Fallback data (failed fetches or forecasts) is not cached, so the next request tries again
+    if complete:
+        with CACHE_LOCK:
+            RESPONSE_CACHE[response_key] = orjson.dumps(json_response, default=orjson_default, option=ORJSON_OPTIONS)
 
-    # Create response with the requested data
+'''
+API route path is  "/api/github"
+This API will accept only POST request
+'''
+@app.route('/api/github', methods=['POST'])
+def github():
+    body = request.get_json()
+    # Extract the choosen repositories from the request
+    repo_name = body['repository']
+    # Extract the data type from the request (issues, pulls, commits, branches, contributors, releases or all)
+    data_type = body.get('dataType', 'issues')  # Default to issues if not specified
+    # Extract the model type from the request (lstm, statsmodel, or prophet)
+    model_type = body.get('modelType', 'lstm')  # Default to lstm if not specified
+    # Stream the response as NDJSON, one line per part as it is ready (see stream_github_response)
+    stream = body.get('stream', False)  # Default to a single JSON response
+    
+    today = date.today()
+    
+    # Serve repeated requests from the response cache, which holds the already encoded JSON
+    # (a streamed request gets it as a single line)
+    response_key = (repo_name, data_type, model_type, today.isoformat())
+    with CACHE_LOCK:
+        if response_key in RESPONSE_CACHE:
+            if stream:
+                return Response(RESPONSE_CACHE[response_key] + b"\n", mimetype='application/x-ndjson')
+            return Response(RESPONSE_CACHE[response_key], mimetype='application/json')
+    
+    # Add your own GitHub Token to run it local
+    token = os.environ.get(
+        'GITHUB_TOKEN', 'YOUR_GITHUB_TOKEN')
+    headers = {
+        "Authorization": f'token {token}'
+    }
+    # Fetch the repository information (stars, forks) from GitHub API
+    try:
+        repository = fetch_repository(repo_name, headers)
+    except requests.HTTPError as e:
+        print(f"API Error: {str(e)}")
+        return jsonify({"error": "Repository Not Available"}), e.response.status_code
+    
+    # Initialize response data, the requested data types fill in their part
     json_response = {
-        "created": created_at_issues,
-        "closed": closed_at_issues,
-        "pulls": pulls_data,
-        "commits": commits_data,
-        "branches": branches_data,
-        "contributors": contributors_data,
-        "releases": releases_data,
+        "created": [],
+        "closed": [],
+        "pulls": [],
+        "commits": [],
+        # True when the busiest months had more commits than GH_MAX_PAGES_PER_MONTH pages
+        "commitsTruncated": False,
+        "branches": [],
+        "contributors": [],
+        "releases": [],
         "starCount": repository["stargazers_count"],
         "forkCount": repository["forks_count"],
-        "createdAtImageUrls": created_at_image_urls,
-        "closedAtImageUrls": closed_at_image_urls,
-        "pullsImageUrls": pulls_image_urls,
-        "commitsImageUrls": commits_image_urls,
-        "branchesImageUrls": branches_image_urls,
-        "contributorsImageUrls": contributors_image_urls,
-        "releasesImageUrls": releases_image_urls,
+        "createdAtImageUrls": {},
+        "closedAtImageUrls": {},
+        "pullsImageUrls": {},
+        "commitsImageUrls": {},
+        "branchesImageUrls": {},
+        "contributorsImageUrls": {},
+        "releasesImageUrls": {},
     }
+
+    # Choose endpoint based on model type (any other model type uses prophet)
+    FORECAST_API_URL = FORECAST_URLS.get(model_type, FORECAST_URLS['prophet'])
+    
+    if stream:
+        if data_type == 'all':
+            builders = dict(DATA_TYPE_BUILDERS)
+        else:
+            builders = {data_type: DATA_TYPE_BUILDERS[data_type]} if data_type in DATA_TYPE_BUILDERS else {}
+        return Response(stream_with_context(stream_github_response(
+                            json_response, builders, (repo_name, today, headers, FORECAST_API_URL), response_key)),
+                        mimetype='application/x-ndjson')
     
+    # Process based on data type requested
+    complete = True
+    if data_type == 'all':
+        # The data types are independent and mostly wait on GitHub and the forecasting service,
+        # so they are built concurrently
+        with ThreadPoolExecutor(max_workers=len(DATA_TYPE_BUILDERS)) as executor:
+            futures = [executor.submit(collect_builder_parts, build_data, (repo_name, today, headers, FORECAST_API_URL))
+                       for build_data in DATA_TYPE_BUILDERS.values()]
+            for data_type_name, future in zip(DATA_TYPE_BUILDERS, futures):
+                # A data type that fails keeps its empty defaults instead of failing the whole response
+                try:
+                    parts = future.result()
+                except Exception as e:
+                    print(f"Error building {data_type_name} data: {str(e)}")
+                    parts = [({}, False)]
+                for part, part_complete in parts:
+                    json_response.update(part)
+                    complete = complete and part_complete
+    elif data_type in DATA_TYPE_BUILDERS:
+        for part, part_complete in collect_builder_parts(DATA_TYPE_BUILDERS[data_type], (repo_name, today, headers, FORECAST_API_URL)):
+            json_response.update(part)
+            complete = complete and part_complete
+
+    # Encode the response once, the cache keeps the bytes for the repeated requests
+    # (fallback data from failed fetches or forecasts is not cached, so the next request tries again)
+    response_body = orjson.dumps(json_response, default=orjson_default, option=ORJSON_OPTIONS)
+    if complete:
+        with CACHE_LOCK:
+            RESPONSE_CACHE[response_key] = response_body
+
     # Return the response back to client (React app)
-    return jsonify(json_response)
+    return Response(response_body, mimetype='application/json')
+
+# GitHub search stops after this many results, whatever the issueCount
+SEARCH_RESULT_LIMIT = 1000
+
+# Most parts a busy month is split into after its first page, the parts are searched together in the next request
+SEARCH_MONTH_PARTS = 8
+
+# GraphQL search for the issues and pull requests created in one month, sent as an aliased sub-query
+# so all months fit in one request; each month has its own search and cursor variables
+GITHUB_ITEMS_MONTH_QUERY = """
+  %(alias)s: search(query: $%(alias)s_q, type: ISSUE, first: 100, after: $%(alias)s_cursor) {
+    issueCount
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+    nodes {
+      ...SearchItem
+    }
+  }
+"""
+
+# Fields of an issue or pull request, sent once per request instead of once per month
+# Only the fields that are used are requested (the REST API returns ~40 per item),
+# __typename tells issues and pull requests apart
+# The shared fields are selected through the interfaces both types implement, which also avoids
+# the conflicting IssueState and PullRequestState types of their state fields
+SEARCH_ITEM_FRAGMENT = """
+fragment SearchItem on SearchResultItem {
+  __typename
+  ... on Issue {
+    number
+  }
+  ... on PullRequest {
+    number
+  }
+  ... on Comment {
+    createdAt
+    author {
+      login
+    }
+  }
+  ... on Closable {
+    closed
+    closedAt
+  }
+  ... on Labelable {
+    labels(first: 20) {
+      nodes {
+        name
+      }
+    }
+  }
+}
+"""
 
 '''
-Helper function to fetch GitHub data (issues or pull requests)
+Helper function to build the search query of the given months (and parts of split months)
+Built once per combination of months, like the commits query
 '''
-def fetch_github_data(repo_name, today, headers, params, data_type):
-    GITHUB_URL = "https://api.github.com/"
-    response_data = []
+@lru_cache(maxsize=256)
+def items_query(aliases):
+    declarations = ", ".join(f"${alias}_q: String!, ${alias}_cursor: String" for alias in aliases)
+    return (f"query({declarations}) {{" + "".join(GITHUB_ITEMS_MONTH_QUERY % {"alias": alias} for alias in aliases) + "}"
+            + SEARCH_ITEM_FRAGMENT)
+
+'''
+Helper function to get the names of the label nodes of an issue or pull request
+'''
+def label_names(labels):
+    return tuple(label['name'] for label in labels) if labels else ()
+
+'''
+Helper function to fetch GitHub data (issues and pull requests) created in the past 12 months using GraphQL API
+Every month is an aliased search of a single request, follow-up requests only include
+the months that still have more pages (GitHub search returns at most 1000 items per query)
+A month with more than one further page left is split by creation time into parts,
+so its pages are fetched side by side instead of one cursor after the other
+Returns the issues and the pull requests as two DataFrames keyed by data type ('issue' and 'pr'),
+and whether every request succeeded
+'''
+async def fetch_github_data(repo_name, today, headers):
+    search_format = f"repo:{repo_name} created:%s sort:created-desc"
     
-    # Iterating to get data for every month for the past 12 months
-    for i in range(12):
-        last_month = today + dateutil.relativedelta.relativedelta(months=-1)
-        
-        if data_type == 'issue':
-            types = 'type:issue'
-        else:
-            types = 'type:pr'
-            
-        repo = 'repo:' + repo_name
-        ranges = 'created:' + str(last_month) + '..' + str(today)
-        per_page = 'per_page=100'
+    # Search ranges include both days, so the day a month starts on is left to that month
+    # (the newest month ends today)
+    searches = {}
+    month_starts = {}
+    for i, (month_start, month_end) in enumerate(month_ranges(today.isoformat())):
+        until = month_end if month_end == today else month_end - timedelta(days=1)
+        searches[f"m{i}"] = search_format % f"{month_start}..{until}"
+        month_starts[f"m{i}"] = datetime(month_start.year, month_start.month, month_start.day)
+    month_data = {alias: [] for alias in searches}
+    
+    # Searches of each month, newest first (a split month lists its parts after its first page)
+    month_parts = {alias: [alias] for alias in searches}
+    
+    # Months that ended before today can come from the month cache (their searches include the repository and dates)
+    with CACHE_LOCK:
+        cached = {alias: MONTH_CACHE[('items', search)] for alias, search in searches.items()
+                  if alias != 'm0' and ('items', search) in MONTH_CACHE}
+    month_data.update(cached)
+    complete = True
+    
+    # Months still to fetch and the cursor of their next page
+    cursors = {alias: None for alias in searches if alias not in cached}
+    
+    while cursors:
+        # Set the variables of the months in this request
+        variables = {}
+        for alias, cursor in cursors.items():
+            variables[f"{alias}_q"] = searches[alias]
+            variables[f"{alias}_cursor"] = cursor
         
-        # Search query will create a query to fetch data for a given repository in a given time range
-        search_query = types + ' ' + repo + ' ' + ranges
-
-        # Variables for pagination
-        page = 1
-        has_more_pages = True
-        month_item_count = 0
+        query = items_query(tuple(cursors))
         
-        # Get all items per month with pagination (no limit)
-        while has_more_pages:
-            # Append the search query to the GitHub API URL 
-            query_url = GITHUB_URL + f"search/issues?q={search_query}&{per_page}&page={page}"
+        try:
+            # Make POST request to GitHub GraphQL API
+            graphql_response = await post_graphql({"query": query, "variables": variables}, headers)
             
-            # requests.get will fetch requested query_url from the GitHub API
-            search_results = requests.get(query_url, headers=headers, params=params)
+            # Process response
+            result = json_of(graphql_response)
             
-            # Convert the data obtained from GitHub API to JSON format
-            search_results = search_results.json()
-            results_items = []
+            if 'errors' in result:
+                print(f"GraphQL Error: {result['errors']}")
+                complete = False
+                break
             
-            try:
-                # Extract "items" from search results
-                results_items = search_results.get("items", [])
-                total_count = search_results.get("total_count", 0)
-                
-                batch_size = len(results_items)
-                month_item_count += batch_size
-                
-                if batch_size == 0:
-                    has_more_pages = False
-                    break
-                
-                for item in results_items:
-                    label_name = []
-                    data = {}
-                    current_item = item
-                    
-                    # Get issue/PR number
-                    data['issue_number'] = current_item["number"]
-                    
-                    # Get created date
-                    data['created_at'] = current_item["created_at"][0:10]
-                    
-                    if current_item["closed_at"] == None:
-                        data['closed_at'] = current_item["closed_at"]
-                    else:
-                        # Get closed date
-                        data['closed_at'] = current_item["closed_at"][0:10]
-                        
-                    for label in current_item["labels"]:
-                        # Get label name
-                        label_name.append(label["name"])
-                        
-                    data['labels'] = label_name
-                    
-                    # It gives state like closed or open
-                    data['State'] = current_item["state"]
-                    
-                    # Get Author
-                    data['Author'] = current_item["user"]["login"]
-                    
-                    # Add a flag to identify if it's a pull request
-                    data['is_pull_request'] = 'pull_request' in current_item
-                    
-                    response_data.append(data)
-                
-                # Check if we have more pages
-                page += 1
-                has_more_pages = batch_size == 100
-                    
-            except KeyError as e:
-                print(f"API Error: {str(e)}")
-                error = {"error": "Data Not Available"}
-                resp = Response(json.dumps(error), mimetype='application/json')
-                resp.status_code = 500
-                has_more_pages = False
+            next_cursors = {}
+            for alias in cursors:
+                items = result['data'][alias]
+                month_data[alias].extend(items['nodes'])
                 
-            except Exception as e:
-                print(f"Unexpected error: {str(e)}")
-                has_more_pages = False
+                # The total from the first page tells exactly how many pages the month has
+                remaining = items['issueCount'] - len(month_data[alias])
+                if alias in month_parts and cursors[alias] is None and items['pageInfo']['hasNextPage'] and remaining > 100:
+                    # Split the rest of the month, up to the oldest item so far, into equal time ranges
+                    # (each part has its own 1000 results limit; items on the bounds are fetched twice and deduplicated)
+                    end = datetime.strptime(items['nodes'][-1]['createdAt'], "%Y-%m-%dT%H:%M:%SZ")
+                    n_parts = min(SEARCH_MONTH_PARTS, math.ceil(remaining / 100))
+                    step = (end - month_starts[alias]) / n_parts
+                    for j in range(n_parts):
+                        part = f"{alias}_{j}"
+                        part_start, part_end = end - step * (j + 1), end - step * j
+                        searches[part] = search_format % (f"{part_start:%Y-%m-%dT%H:%M:%SZ}..{part_end:%Y-%m-%dT%H:%M:%SZ}")
+                        month_data[part] = []
+                        month_parts[alias].append(part)
+                        next_cursors[part] = None
+                    continue
                 
-        today = last_month
+                if cursors[alias] is None and items['issueCount'] > SEARCH_RESULT_LIMIT:
+                    print(f"Only the first {SEARCH_RESULT_LIMIT} of {items['issueCount']} results of '{searches[alias]}' can be fetched")
+                if items['pageInfo']['hasNextPage'] and len(month_data[alias]) < min(items['issueCount'], SEARCH_RESULT_LIMIT):
+                    next_cursors[alias] = items['pageInfo']['endCursor']
+            
+            cursors = next_cursors
+            
+        except httpx.HTTPError as e:
+            # Transport errors after the retries, and error statuses (json_of raises httpx.HTTPStatusError)
+            print(f"GitHub request for issues and pull requests failed: {str(e)}")
+            complete = False
+            break
+        except Exception as e:
+            print(f"Error processing issues and pull requests: {str(e)}")
+            complete = False
+            break
+    
+    # Keep the fetched months that ended before today for the next requests, unless a request failed part way
+    if complete:
+        with CACHE_LOCK:
+            for alias in month_parts.keys() - cached.keys() - {'m0'}:
+                MONTH_CACHE[('items', searches[alias])] = [node for part in month_parts[alias] for node in month_data[part]]
+    
+    # Combine the months in order, newest first, keeping one of the items fetched twice by split months
+    response_data = list({node['number']: node for alias in month_parts
+                          for part in month_parts[alias] for node in month_data[part]}.values())
         
-    return response_data
+    # Split the nodes by type once, each type gets its own DataFrame without masking a combined one
+    nodes_by_type = {'issue': [], 'pr': []}
+    for node in response_data:
+        nodes_by_type['pr' if node['__typename'] == 'PullRequest' else 'issue'].append(node)
+    
+    return {data_type: items_frame(nodes) for data_type, nodes in nodes_by_type.items()}, complete
+
+'''
+Helper function to build the DataFrame of issue or pull request search nodes
+Each column is collected as a list in one comprehension per field, then the DataFrame is built once
+(much faster than flattening the nested nodes with pd.json_normalize)
+'''
+def items_frame(nodes):
+    if not nodes:
+        return pd.DataFrame()
+    
+    closed_dates = [node['closedAt'] for node in nodes]
+    return pd.DataFrame({
+        'issue_number': [node['number'] for node in nodes],
+        'created_at': [node['createdAt'][:10] for node in nodes],
+        # Object dtype keeps missing closed dates as None so they serialize to JSON null
+        'closed_at': pd.Series([closed_at[:10] if closed_at else None for closed_at in closed_dates], dtype=object),
+        'labels': [label_names(node['labels']['nodes']) for node in nodes],
+        # Merged pull requests are closed, as in the REST API
+        # (only a few distinct states and authors, so they are stored as categories)
+        'State': pd.Categorical(['closed' if node['closed'] else 'open' for node in nodes], categories=['open', 'closed']),
+        # Deleted accounts have no author
+        'Author': pd.Categorical([(node['author'] or {}).get('login', 'ghost') for node in nodes]),
+    })
+
+# Below this many dates the Numba JIT warmup costs more than the pandas path
+NUMBA_MIN_DATES = 10_000
+
+# Below this many dates hashing them for the cache takes longer than counting them again
+MONTHLY_COUNTS_CACHE_MIN_DATES = 2_000
+
+'''
+Numba kernel counting month indexes into buckets starting at the base month
+Months outside the buckets are skipped in the same loop, so no filtered copy of the months is needed
+'''
+if njit is not None:
+    @njit(cache=True)
+    def count_month_buckets(months, base, n_buckets):
+        counts = np.zeros(n_buckets, np.int64)
+        for month in months:
+            offset = month - base
+            if 0 <= offset < n_buckets:
+                counts[offset] += 1
+        return counts
+
+'''
+Helper function to count dates per month, the dates are parsed datetimes or YYYY-MM-DD strings
+Returns [month, count] pairs for every month of month_range (first and last date, both months included), or from the first
+to the last date when no range is given. Missing dates (NaT/None) are ignored
+'''
+def monthly_counts(dates, month_range=None):
+    if dates.empty:
+        return []
+    
+    # The same dates (e.g. the cached GitHub data of a repository) give the same counts,
+    # small inputs go straight to the numpy path
+    key = None
+    if len(dates) >= MONTHLY_COUNTS_CACHE_MIN_DATES:
+        key = (hashlib.blake2b(pd.util.hash_pandas_object(dates, index=False).to_numpy().tobytes(), digest_size=16).digest(),
+               None if month_range is None else tuple(str(day)[:10] for day in month_range))
+        with CACHE_LOCK:
+            if key in MONTHLY_COUNTS_CACHE:
+                return MONTHLY_COUNTS_CACHE[key]
+    
+    # Months since 1970-01 for every date, the buckets are counted on these offsets
+    # Only the distinct dates are parsed (a year of items has at most a few hundred), numpy parses
+    # ISO date strings itself, much faster than pd.to_datetime; missing dates get code -1
+    # and are masked out instead of a dropna copy of the series
+    codes, unique_dates = pd.factorize(dates)
+    unique_months = np.asarray(unique_dates, dtype='datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    months = unique_months[codes[codes >= 0]]
+    if len(months) == 0:
+        return []
+    if month_range is None:
+        base, n_buckets = months.min(), months.max() - months.min() + 1
+    else:
+        # Same months-since-1970-01 offsets for the bounds, no PeriodIndex needed
+        first, last = np.array([str(day)[:10] for day in month_range], dtype='datetime64[D]').astype('datetime64[M]').astype(np.int64)
+        base, n_buckets = first, last - first + 1
+    
+    # Months without any dates are zero buckets
+    if njit is not None and len(months) >= NUMBA_MIN_DATES:
+        counts = count_month_buckets(months, base, n_buckets)
+    else:
+        if month_range is not None:
+            months = months[(months >= base) & (months < base + n_buckets)]
+        counts = np.bincount(months - base, minlength=n_buckets)
+    
+    labels = np.arange(base, base + n_buckets).astype('datetime64[M]').astype(str)
+    pairs = [[month, count] for month, count in zip(labels.tolist(), counts.tolist())]
+    
+    if key is not None:
+        with CACHE_LOCK:
+            MONTHLY_COUNTS_CACHE[key] = pairs
+    
+    return pairs
 
 '''
 Helper function to format GitHub issues data for the frontend
 '''
-def format_github_data(df):
+def format_github_data(df, today):
     if df.empty:
         return [], []
-        
-    # Daily Created Issues
-    df_created_at = df.groupby(['created_at'], as_index=False).count()
-    dataFrameCreated = df_created_at[['created_at', 'issue_number']]
-    dataFrameCreated.columns = ['date', 'count']
+
+    # Both charts share the months from the start of the fetched period to the current month
+    month_range = (month_ranges(today.isoformat())[-1][0], today)
 
     # Monthly Created Issues
-    created_at = df['created_at']
-    month_issue_created = pd.to_datetime(
-        pd.Series(created_at), format='%Y-%m-%d')
-    month_issue_created.index = month_issue_created.dt.to_period('m')
-    month_issue_created = month_issue_created.groupby(level=0).size()
-    month_issue_created = month_issue_created.reindex(pd.period_range(
-        month_issue_created.index.min(), month_issue_created.index.max(), freq='m'), fill_value=0)
-    month_issue_created_dict = month_issue_created.to_dict()
-    created_at_issues = []
-    for key in month_issue_created_dict.keys():
-        array = [str(key), month_issue_created_dict[key]]
-        created_at_issues.append(array)
-
-    # Monthly Closed Issues
-    closed_at = df['closed_at'].sort_values(ascending=True)
-    # Filter out None values
-    closed_at = closed_at[closed_at.notnull()]
-    
-    if len(closed_at) > 0:
-        month_issue_closed = pd.to_datetime(
-            pd.Series(closed_at), format='%Y-%m-%d')
-        month_issue_closed.index = month_issue_closed.dt.to_period('m')
-        month_issue_closed = month_issue_closed.groupby(level=0).size()
-        month_issue_closed = month_issue_closed.reindex(pd.period_range(
-            month_issue_closed.index.min(), month_issue_closed.index.max(), freq='m'), fill_value=0)
-        month_issue_closed_dict = month_issue_closed.to_dict()
-        closed_at_issues = []
-        for key in month_issue_closed_dict.keys():
-            array = [str(key), month_issue_closed_dict[key]]
-            closed_at_issues.append(array)
-    else:
-        closed_at_issues = []
+    created_at_issues = monthly_counts(df['created_at'], month_range)
+
+    # Monthly Closed Issues (issues that are still open have no closed date)
+    closed_at_issues = monthly_counts(df['closed_at'], month_range)
         
     return created_at_issues, closed_at_issues
 
@@ -1280,28 +1851,12 @@ def format_pulls_data(df):
     if df.empty:
         return []
         
-    # Filter only pull requests
-    df_pulls = df[df['is_pull_request'] == True]
-    
-    if df_pulls.empty:
-        return []
-        
-    # Monthly Pull Requests
-    created_at = df_pulls['created_at']
-    month_pulls_created = pd.to_datetime(
-        pd.Series(created_at), format='%Y-%m-%d')
-    month_pulls_created.index = month_pulls_created.dt.to_period('m')
-    month_pulls_created = month_pulls_created.groupby(level=0).size()
-    month_pulls_created = month_pulls_created.reindex(pd.period_range(
-        month_pulls_created.index.min(), month_pulls_created.index.max(), freq='m'), fill_value=0)
-    month_pulls_created_dict = month_pulls_created.to_dict()
-    pulls_data = []
-    for key in month_pulls_created_dict.keys():
-        array = [str(key), month_pulls_created_dict[key]]
-        pulls_data.append(array)
+    # Monthly Pull Requests (the pulls fetch only returns pull requests)
+    pulls_data = monthly_counts(df['created_at'])
         
     return pulls_data
 
-# Run flask app server on port 5000
+# Run flask development server on port 5000 (production uses gunicorn, see Dockerfile)
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    app.run(debug=os.environ.get('FLASK_ENV', '') == 'development',
+            host='0.0.0.0', port=int(os.environ.get('PORT', 5000)))
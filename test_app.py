@@ -0,0 +1,147 @@
+'''
+Tests of the GitHub search fetch (month splitting, deduplication, incomplete fetches)
+and of the order of the streamed /api/github response
+GitHub and the forecasting service are mocked, run with: python -m pytest
+'''
+import threading
+from datetime import date
+
+import httpx
+import orjson
+import pytest
+
+import app
+
+TODAY = date(2024, 6, 1)
+
+# Oldest item of the first page of the busy month, the rest of the month is split up to it
+FIRST_PAGE_OLDEST = "2024-05-21T00:00:00Z"
+
+'''
+Helper function to build an issue search node
+'''
+def issue_node(number, created_at):
+    return {"__typename": "Issue", "number": number, "createdAt": created_at, "closedAt": None,
+            "closed": False, "author": {"login": "octocat"}, "labels": {"nodes": []}}
+
+'''
+Helper function to build the search result of one month (or part of a month)
+'''
+def search_result(nodes, issue_count, has_next_page=False):
+    return {"issueCount": issue_count, "pageInfo": {"hasNextPage": has_next_page, "endCursor": "next" if has_next_page else None},
+            "nodes": nodes}
+
+'''
+Helper function to mock post_graphql with GitHub search results
+The newest month (m0) has 250 items: its first page ends at FIRST_PAGE_OLDEST, so the rest is split into two parts
+whose items on the bounds are returned twice; failing_alias gets a 502 instead
+Returns the aliases of every request
+'''
+def mock_search(monkeypatch, failing_alias=None):
+    requests_made = []
+
+    async def post_graphql(payload, headers, retries=5):
+        aliases = [name[:-2] for name in payload["variables"] if name.endswith("_q")]
+        requests_made.append(aliases)
+        request = httpx.Request("POST", app.GITHUB_GRAPHQL_URL)
+        if failing_alias in aliases:
+            return httpx.Response(502, request=request)
+
+        data = {}
+        for alias in aliases:
+            if alias == "m0":
+                # 100 items, the last one created at FIRST_PAGE_OLDEST
+                nodes = [issue_node(1000 - i, "2024-05-31T00:00:00Z") for i in range(99)] + [issue_node(901, FIRST_PAGE_OLDEST)]
+                data[alias] = search_result(nodes, 250, has_next_page=True)
+            elif alias == "m0_0":
+                # Newer part, also returns the oldest item of the first page
+                nodes = [issue_node(901, FIRST_PAGE_OLDEST)] + [issue_node(851 - i, "2024-05-15T00:00:00Z") for i in range(52)]
+                data[alias] = search_result(nodes, 53)
+            elif alias == "m0_1":
+                # Older part, also returns the oldest item of the newer part
+                nodes = [issue_node(800, "2024-05-11T00:00:00Z")] + [issue_node(799 - i, "2024-05-05T00:00:00Z") for i in range(50)]
+                data[alias] = search_result(nodes, 51)
+            else:
+                data[alias] = search_result([], 0)
+        return httpx.Response(200, content=orjson.dumps({"data": data}), request=request)
+
+    monkeypatch.setattr(app, "post_graphql", post_graphql)
+    return requests_made
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    for cache in (app.MONTH_CACHE, app.GITHUB_DATA_CACHE, app.RESPONSE_CACHE, app.FORECAST_CACHE):
+        cache.clear()
+    yield
+
+def test_busy_month_is_split_and_deduplicated(monkeypatch):
+    requests_made = mock_search(monkeypatch)
+
+    frames, complete = app.run_github(app.fetch_github_data("octo/repo", TODAY, {}))
+
+    assert complete
+    # All the months first, then the two parts of the busy month side by side
+    assert requests_made == [[f"m{i}" for i in range(12)], ["m0_0", "m0_1"]]
+    numbers = frames["issue"]["issue_number"].tolist()
+    # 100 + 52 + 50 items, the two items on the part bounds are kept once
+    assert len(numbers) == len(set(numbers)) == 202
+    assert frames["pr"].empty
+
+def test_split_parts_cover_the_rest_of_the_month(monkeypatch):
+    searches = []
+    mock_search(monkeypatch)
+    post_graphql = app.post_graphql
+
+    async def recording_post_graphql(payload, headers, retries=5):
+        searches.extend(value for name, value in payload["variables"].items() if name in ("m0_0_q", "m0_1_q"))
+        return await post_graphql(payload, headers, retries)
+
+    monkeypatch.setattr(app, "post_graphql", recording_post_graphql)
+    app.run_github(app.fetch_github_data("octo/repo", TODAY, {}))
+
+    assert searches == [
+        "repo:octo/repo created:2024-05-11T00:00:00Z..2024-05-21T00:00:00Z sort:created-desc",
+        "repo:octo/repo created:2024-05-01T00:00:00Z..2024-05-11T00:00:00Z sort:created-desc",
+    ]
+
+def test_failed_part_page_makes_the_fetch_incomplete(monkeypatch):
+    mock_search(monkeypatch, failing_alias="m0_0")
+
+    frames, complete = app.run_github(app.fetch_github_data("octo/repo", TODAY, {}))
+
+    assert not complete
+    # The first page is still returned, but not cached
+    assert len(frames["issue"]) == 100
+    df, fetched = app.get_github_data("octo/repo", TODAY, {}, "issue")
+    assert not fetched
+    assert not app.GITHUB_DATA_CACHE
+
+def test_stream_sends_chart_data_before_the_forecast(monkeypatch):
+    forecast_started = threading.Event()
+    release_forecast = threading.Event()
+
+    def post_forecast(url, body, timeout=None):
+        forecast_started.set()
+        assert release_forecast.wait(10)
+        return {"model_loss_image_url": "loss.png"}
+
+    monkeypatch.setattr(app, "fetch_repository", lambda repo_name, headers: {"stargazers_count": 1, "forks_count": 2})
+    monkeypatch.setattr(app, "fetch_github_commits",
+                        lambda repo_name, today, headers: ({"commit_hash": ["abc"], "committed_at": ["2024-05-01"]}, False, True))
+    monkeypatch.setattr(app, "post_forecast", post_forecast)
+
+    response = app.app.test_client().post("/api/github", json={"repository": "octo/repo", "dataType": "commits", "stream": True},
+                                          buffered=False)
+    lines = iter(response.response)
+
+    assert set(orjson.loads(next(lines))) >= {"commits", "starCount"}
+    # The commits chart arrives while the forecast is still running
+    assert orjson.loads(next(lines)) == {"commits": [["2024-05", 1]], "commitsTruncated": False}
+    assert forecast_started.wait(10)
+    release_forecast.set()
+    assert orjson.loads(next(lines)) == {"commitsImageUrls": {"model_loss_image_url": "loss.png"}}
+    assert list(lines) == []
+    response.close()
+
+    # Every part was complete, so the response is cached
+    assert len(app.RESPONSE_CACHE) == 1